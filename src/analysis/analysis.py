@@ -10,6 +10,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from collections import Counter
+from functools import lru_cache
 from typing import Optional, List, Set, Dict
 
 class LibraryAnalyzer:
@@ -183,21 +184,37 @@ def get_genres_list(x) -> List[str]:
     if isinstance(x, list):
         return x
     if isinstance(x, str):
-        if x == '[]' or x == '' or x.lower() == 'nan':
-            return []
-        try:
-            import ast
-            val = ast.literal_eval(x)
-            if isinstance(val, (list, tuple, set)):
-                return list(val)
-            return [val]
-        except:
-            if ',' in x:
-                return [t.strip() for t in x.split(',') if t.strip()]
-            return [x]
+        # Serialized genre lists repeat heavily across artists; parse each distinct one once
+        return list(_parse_genres_str(x))
     return []
 
 
+def _genres_tuple(x) -> tuple:
+    """get_genres_list as a tuple: parsed strings share their cached tuple instead of being copied."""
+    if isinstance(x, str):
+        return _parse_genres_str(x)
+    if isinstance(x, (np.ndarray, list)):
+        return tuple(x)
+    return ()
+
+
+@lru_cache(maxsize=None)
+def _parse_genres_str(x: str) -> tuple:
+    """Parse a serialized genres string (cached; returned as a tuple so it can be shared)."""
+    if x == '[]' or x == '' or x.lower() == 'nan':
+        return ()
+    try:
+        import ast
+        val = ast.literal_eval(x)
+        if isinstance(val, (list, tuple, set)):
+            return tuple(val)
+        return (val,)
+    except:
+        if ',' in x:
+            return tuple(t.strip() for t in x.split(',') if t.strip())
+        return (x,)
+
+
 def build_playlist_genre_profiles(
     playlists: pd.DataFrame,
     playlist_tracks: pd.DataFrame,
@@ -209,20 +226,20 @@ def build_playlist_genre_profiles(
     Returns:
         Dict mapping playlist_id -> Counter of genre counts
     """
-    # Build track -> genres mapping via primary artist
-    primary_artists = track_artists[track_artists["position"] == 0].copy()
-    track_genres = primary_artists.merge(artists[["artist_id", "genres"]], on="artist_id")
-    track_genres["genres_list"] = track_genres["genres"].apply(get_genres_list)
-    track_genres_map = track_genres.set_index("track_id")["genres_list"].to_dict()
+    # Build track -> genres mapping via primary artist (genres parsed once per artist)
+    primary_artists = track_artists.loc[track_artists["position"] == 0, ["track_id", "artist_id"]]
+    artist_genres = artists[["artist_id"]].assign(genres_list=artists["genres"].map(_genres_tuple))
+    track_genres = primary_artists.merge(artist_genres, on="artist_id").drop_duplicates("track_id", keep="last")
+    
+    # One join + groupby over all playlists instead of a scan per playlist
+    pids = playlists["playlist_id"]
+    pt = playlist_tracks.loc[playlist_tracks["playlist_id"].isin(pids), ["playlist_id", "track_id"]]
+    pt_genres = pt.merge(track_genres[["track_id", "genres_list"]], on="track_id").explode("genres_list")
+    counts = pt_genres.dropna(subset=["genres_list"]).groupby(["playlist_id", "genres_list"], sort=False).size()
     
-    profiles = {}
-    for _, row in playlists.iterrows():
-        pid = row["playlist_id"]
-        pt = playlist_tracks[playlist_tracks["playlist_id"] == pid]
-        genres = Counter()
-        for tid in pt["track_id"]:
-            genres.update(track_genres_map.get(tid, []))
-        profiles[pid] = genres
+    profiles = {pid: Counter() for pid in pids}
+    for (pid, genre), n in zip(counts.index, counts.to_numpy()):
+        profiles[pid][genre] = int(n)
     
     return profiles
 
@@ -267,22 +284,20 @@ class PlaylistSimilarityEngine:
             self.analyzer.artists_all
         )
         
-        # Get all unique genres
-        all_genres_set = set()
-        for genres in self._profiles.values():
-            all_genres_set.update(genres.keys())
-        self._all_genres = sorted(list(all_genres_set))
+        # Get all unique genres (one union over every profile)
+        self._all_genres = sorted(set().union(*self._profiles.values()))
         
-        # Build vectors
+        # Build vectors: fill each row from its own genres only, then normalize all rows at once
         self._playlist_ids = list(self._profiles.keys())
-        vectors = []
-        for pid in self._playlist_ids:
-            genres = self._profiles.get(pid, Counter())
-            total = sum(genres.values()) or 1
-            vec = [genres.get(g, 0) / total for g in self._all_genres]
-            vectors.append(vec)
-        
-        self._vectors = np.array(vectors)
+        column = {g: j for j, g in enumerate(self._all_genres)}
+        vectors = np.zeros((len(self._playlist_ids), len(self._all_genres)))
+        for i, pid in enumerate(self._playlist_ids):
+            for genre, n in self._profiles[pid].items():
+                vectors[i, column[genre]] = n
+        totals = vectors.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1
+        
+        self._vectors = vectors / totals
         self._built = True
         return self
     
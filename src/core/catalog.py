@@ -23,6 +23,33 @@ class CacheConfig:
         if isinstance(self.dir, str):
             self.dir = Path(self.dir)
 
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write df to parquet, typing a "genres" column as list<string>.
+    Without the explicit type an all-empty column is stored as null and reads back as
+    None; with it, readers always get list cells (no string parsing) and Parquet
+    dictionary-encodes the repeated genre strings.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        pa = None
+    if pa is not None and "genres" in df.columns:
+        try:
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+            schema = schema.set(
+                schema.get_field_index("genres"), pa.field("genres", pa.list_(pa.string()))
+            )
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+        except (TypeError, ValueError, pa.ArrowException):
+            pass  # genres not list-like (e.g. legacy strings): let pandas infer
+        else:
+            pq.write_table(table, path)
+            return
+    df.to_parquet(path, index=False)
+
+
 class DataCatalog:
     """Stores cached tables + metadata (snapshots, pull timestamps)."""
 
@@ -72,7 +99,7 @@ class DataCatalog:
             return df
         p = self.table_path(key)
         if self.cache.fmt == "parquet":
-            df.to_parquet(p, index=False)
+            _write_parquet(df, p)
         else:
             df.to_csv(p, index=False)
         return df
@@ -524,7 +524,7 @@ class Spotim8:
         existing_df = self.catalog.load(key)
         existing_genres = {}
         if existing_df is not None and "genres" in existing_df.columns:
-            existing_genres = existing_df.set_index("track_id")["genres"].to_dict()
+            existing_genres = dict(zip(existing_df["track_id"].to_numpy(), existing_df["genres"].to_numpy()))
 
         rows = []
         iterator = list(chunks(ids, 50))
@@ -560,13 +560,14 @@ class Spotim8:
                     "track_number": t.get("track_number"),
                     "isrc": ext.get("isrc"),
                     "uri": t.get("uri"),
-                    # Preserve existing genres or initialize to None
-                    "genres": existing_genres.get(track_id, None),
                 })
 
         df = pd.DataFrame(rows).drop_duplicates("track_id")
-        # Ensure genres column exists (in case no existing data)
-        if "genres" not in df.columns:
+        # Preserve existing genres (one column-wide lookup) or initialize to None
+        if existing_genres and "track_id" in df.columns:
+            genres = df["track_id"].map(existing_genres)
+            df["genres"] = genres.where(genres.notna(), None)
+        else:
             df["genres"] = None
         return self.catalog.save(key, df)
 
@@ -165,16 +165,12 @@ def release_year_features(
     
     df = wide.copy()
     
-    # Extract year from release date (handles YYYY, YYYY-MM, YYYY-MM-DD formats)
-    def extract_year(x):
-        if pd.isna(x):
-            return np.nan
-        try:
-            return int(str(x)[:4])
-        except Exception:
-            return np.nan
-    
-    df["release_year"] = df[release_date_col].apply(extract_year)
+    # Extract year from release date (handles YYYY, YYYY-MM, YYYY-MM-DD formats);
+    # one vectorized parse of the leading 4 characters, unparseable values become NaN
+    dates = df[release_date_col]
+    df["release_year"] = pd.to_numeric(
+        dates.astype(str).str[:4].where(dates.notna()), errors="coerce"
+    )
     
     g = df.groupby(playlist_col)["release_year"].agg(["mean", "median", "min", "max", "std"]).reset_index()
     g = g.rename(columns={c: f"release_year_{c}" for c in ["mean", "median", "min", "max", "std"]})
@@ -209,20 +205,13 @@ def popularity_tier_features(
     
     df = wide.copy()
     
-    def tier(p):
-        if pd.isna(p):
-            return "unknown"
-        if p <= 20:
-            return "underground"
-        if p <= 40:
-            return "niche"
-        if p <= 60:
-            return "moderate"
-        if p <= 80:
-            return "popular"
-        return "mainstream"
-    
-    df["tier"] = df[popularity_col].apply(tier)
+    # Assign every row's tier in one pass (missing popularity falls through to "unknown")
+    p = pd.to_numeric(df[popularity_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    df["tier"] = np.select(
+        [p <= 20, p <= 40, p <= 60, p <= 80, p > 80],
+        ["underground", "niche", "moderate", "popular", "mainstream"],
+        default="unknown",
+    )
     
     # Calculate tier percentages
     tier_counts = df.groupby([playlist_col, "tier"])["track_id"].count().unstack(fill_value=0)
@@ -41,10 +41,17 @@ from .api import api_call, get_spotify_client, _chunked
 from .catalog import (
     get_existing_playlists,
     get_playlist_tracks,
+    get_playlists_tracks,
+    get_playlist_snapshot_id,
+    get_playlist_track_total,
+    iter_playlist_track_uris,
     get_liked_song_uris,
     get_user_info,
     _invalidate_playlist_cache,
     _load_genre_data,
+    _load_liked_songs,
+    _load_digest_cache,
+    _save_digest_cache,
     _playlist_cache,
     _playlist_tracks_cache,
 )
@@ -57,7 +64,7 @@ from .tracks import (
     _get_all_track_genres,
     _get_primary_artist_genres,
 )
-from .descriptions import _update_playlist_description_with_genres
+from .descriptions import _update_playlist_description_with_genres, flush_description_snapshot_cache
 from .workflow import sync_full_library, sync_export_data
 from .renames import rename_playlists_with_old_prefixes
 from .history import (
@@ -108,10 +115,17 @@ __all__ = [
     "_chunked",
     "get_existing_playlists",
     "get_playlist_tracks",
+    "get_playlists_tracks",
+    "get_playlist_snapshot_id",
+    "get_playlist_track_total",
+    "iter_playlist_track_uris",
     "get_liked_song_uris",
     "get_user_info",
     "_invalidate_playlist_cache",
     "_load_genre_data",
+    "_load_liked_songs",
+    "_load_digest_cache",
+    "_save_digest_cache",
     "_playlist_cache",
     "_playlist_tracks_cache",
     "_to_uri",
@@ -122,6 +136,7 @@ __all__ = [
     "_get_all_track_genres",
     "_get_primary_artist_genres",
     "_update_playlist_description_with_genres",
+    "flush_description_snapshot_cache",
     "sync_full_library",
     "sync_export_data",
     "rename_playlists_with_old_prefixes",
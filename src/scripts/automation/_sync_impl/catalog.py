@@ -4,9 +4,15 @@ Sync catalog: playlists, playlist tracks, user info.
 In-memory caches for the duration of a run; invalidate after modifying playlists.
 """
 
+from collections import UserDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import pandas as pd
 import spotipy
 
+from src.scripts.common.sidecar import sidecar_path, read_sidecar, write_sidecar
+
 from . import settings
 from . import logger
 from . import api
@@ -15,24 +21,104 @@ from . import api
 _playlist_cache = None
 _playlist_cache_valid = False
 _playlist_tracks_cache = {}
+_playlist_snapshot_cache = {}  # {playlist_id: snapshot_id} from the last playlist listing
+_playlist_total_cache = {}  # {playlist_id: tracks.total} from the last playlist listing
 _user_cache = None
 _genre_data_cache = None
 
 
 def _invalidate_playlist_cache():
     """Invalidate playlist and playlist tracks cache (call after modifying playlists)."""
-    global _playlist_cache, _playlist_tracks_cache, _playlist_cache_valid
+    global _playlist_cache, _playlist_tracks_cache, _playlist_snapshot_cache, _playlist_total_cache
+    global _playlist_cache_valid
     _playlist_cache = None
     _playlist_tracks_cache = {}
+    _playlist_snapshot_cache = {}
+    _playlist_total_cache = {}
     _playlist_cache_valid = False
 
 
+def _load_digest_cache() -> dict:
+    """Load persisted {playlist_id: [snapshot_id, track_count, digest hex]}."""
+    return read_sidecar(sidecar_path(settings.get_sync_data_dir(), "playlist_digest"))
+
+
+def _save_digest_cache(cache: dict) -> None:
+    try:
+        write_sidecar(sidecar_path(settings.get_sync_data_dir(), "playlist_digest"), cache)
+    except OSError as e:
+        logger.verbose_log(f"  Could not save playlist digest cache: {e}")
+
+
+class _PlaylistNameMap(UserDict):
+    """
+    {name: id} whose lookups fall back to a case-insensitive match, so a playlist that
+    comes back with different capitalization ("AJam - Hiphop" vs "AJam - HipHop") is
+    found instead of being recreated as a duplicate. Iteration and keys keep the
+    real names; exact matches never touch the folded index.
+
+    `in`, [], get(), setdefault(), pop() and del resolve a name to the stored entry
+    (exact spelling first, then the first one seen ignoring case). Stores always use
+    the exact name given. Every mutation goes through __setitem__/__delitem__, which
+    drop the folded index; has_exact() checks a spelling without the fallback.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._folded = None
+        super().__init__(*args, **kwargs)
+
+    def _real_name(self, name):
+        """Stored name matching name (exactly, else ignoring case), or None."""
+        if name in self.data:
+            return name
+        if not isinstance(name, str):
+            return None
+        if self._folded is None:
+            folded = {}
+            for real in self.data:
+                folded.setdefault(real.casefold(), real)
+            self._folded = folded
+        return self._folded.get(name.casefold())
+
+    def has_exact(self, name) -> bool:
+        """True if a playlist is stored under exactly this name."""
+        return name in self.data
+
+    def __contains__(self, name):
+        return self._real_name(name) is not None
+
+    def __getitem__(self, name):
+        real = self._real_name(name)
+        if real is None:
+            raise KeyError(name)
+        return self.data[real]
+
+    def __setitem__(self, name, playlist_id):
+        self.data[name] = playlist_id
+        self._folded = None
+
+    def __delitem__(self, name):
+        real = self._real_name(name)
+        if real is None:
+            raise KeyError(name)
+        del self.data[real]
+        self._folded = None
+
+    def __ior__(self, other):
+        # UserDict's |= writes to .data directly, bypassing __setitem__
+        self.update(other)
+        return self
+
+    def copy(self):
+        return type(self)(self.data)
+
+
 def get_existing_playlists(sp: spotipy.Spotify, force_refresh: bool = False) -> dict:
     """
-    Get all user playlists as {name: id}.
+    Get all user playlists as {name: id} (lookups also match names ignoring case).
     Cached in-memory; call _invalidate_playlist_cache() after creating/deleting playlists.
     """
-    global _playlist_cache, _playlist_cache_valid
+    global _playlist_cache, _playlist_snapshot_cache, _playlist_total_cache, _playlist_cache_valid
 
     if _playlist_cache is not None and not force_refresh and _playlist_cache_valid:
         logger.verbose_log(f"Using cached playlists ({len(_playlist_cache)} playlists)")
@@ -40,6 +126,8 @@ def get_existing_playlists(sp: spotipy.Spotify, force_refresh: bool = False) ->
 
     logger.verbose_log(f"Fetching playlists from API (force_refresh={force_refresh})...")
     mapping = {}
+    snapshots = {}
+    totals = {}
     duplicates = []
     offset = 0
     while True:
@@ -53,6 +141,11 @@ def get_existing_playlists(sp: spotipy.Spotify, force_refresh: bool = False) ->
             if name in mapping:
                 duplicates.append(name)
             mapping[name] = item["id"]
+            if item.get("snapshot_id"):
+                snapshots[item["id"]] = item["snapshot_id"]
+            total = (item.get("tracks") or {}).get("total")
+            if total is not None:
+                totals[item["id"]] = total
         if not page.get("next"):
             break
         offset += settings.SPOTIFY_API_PAGINATION_LIMIT
@@ -64,15 +157,45 @@ def get_existing_playlists(sp: spotipy.Spotify, force_refresh: bool = False) ->
             f"{', '.join(unique_dupes[:5])}{'...' if len(unique_dupes) > 5 else ''}"
         )
 
-    _playlist_cache = mapping
+    _playlist_cache = _PlaylistNameMap(mapping)
+    _playlist_snapshot_cache = snapshots
+    _playlist_total_cache = totals
     _playlist_cache_valid = True
-    return mapping
+    return _playlist_cache
+
+
+def get_playlist_snapshot_id(sp: spotipy.Spotify, playlist_id: str) -> str:
+    """
+    Get a playlist's current snapshot_id (changes whenever its tracks change).
+    Taken from the last get_existing_playlists listing when available, otherwise
+    a single metadata request.
+    """
+    snapshot_id = _playlist_snapshot_cache.get(playlist_id)
+    if snapshot_id:
+        return snapshot_id
+    pl = api.api_call(sp.playlist, playlist_id, fields="snapshot_id")
+    return pl.get("snapshot_id") or ""
 
 
-def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, force_refresh: bool = False) -> set:
+def get_playlist_track_total(sp: spotipy.Spotify, playlist_id: str) -> int:
+    """
+    Get a playlist's item count without paging through its tracks.
+    Taken from the last get_existing_playlists listing when available, otherwise
+    a single fields=tracks.total request.
+    """
+    total = _playlist_total_cache.get(playlist_id)
+    if total is not None:
+        return total
+    pl = api.api_call(sp.playlist, playlist_id, fields="tracks.total")
+    return (pl.get("tracks") or {}).get("total", 0)
+
+
+def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, force_refresh: bool = False) -> frozenset:
     """
     Get all track URIs in a playlist.
     Cached in-memory; invalidated for a playlist when tracks are added.
+    Returned as a frozenset: callers test membership against it directly, and the
+    cached value is shared, so it must not be modified in place.
     """
     global _playlist_tracks_cache
 
@@ -83,7 +206,16 @@ def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, force_refresh: bo
         return _playlist_tracks_cache[playlist_id]
 
     logger.verbose_log(f"Fetching tracks for playlist {playlist_id} from API (force_refresh={force_refresh})...")
-    uris = set()
+    uris = frozenset(iter_playlist_track_uris(sp, playlist_id))
+    _playlist_tracks_cache[playlist_id] = uris
+    return uris
+
+
+def iter_playlist_track_uris(sp: spotipy.Spotify, playlist_id: str):
+    """
+    Yield a playlist's track URIs page by page straight from the API (not cached).
+    Lets callers that only need a summary of the tracks avoid holding them all.
+    """
     offset = 0
     while True:
         page = api.api_call(
@@ -94,14 +226,37 @@ def get_playlist_tracks(sp: spotipy.Spotify, playlist_id: str, force_refresh: bo
             offset=offset,
         )
         for item in page.get("items", []):
-            if item.get("track", {}).get("uri"):
-                uris.add(item["track"]["uri"])
+            uri = (item.get("track") or {}).get("uri")
+            if uri:
+                yield uri
         if not page.get("next"):
             break
         offset += 100
 
-    _playlist_tracks_cache[playlist_id] = uris
-    return uris
+
+def get_playlists_tracks(
+    sp: spotipy.Spotify,
+    playlist_ids,
+    force_refresh: bool = False,
+    max_workers: int = None,
+) -> dict:
+    """
+    Get track URIs for many playlists as {playlist_id: frozenset of URIs}.
+    Fetches are network-bound, so uncached playlists are requested concurrently
+    (at most settings.PARALLEL_MAX_WORKERS at a time); results go through the
+    same in-memory cache as get_playlist_tracks.
+    """
+    playlist_ids = list(dict.fromkeys(playlist_ids))
+    if max_workers is None:
+        max_workers = settings.PARALLEL_MAX_WORKERS
+    if len(playlist_ids) <= 1 or max_workers <= 1:
+        return {pid: get_playlist_tracks(sp, pid, force_refresh=force_refresh) for pid in playlist_ids}
+
+    def _fetch(pid):
+        return get_playlist_tracks(sp, pid, force_refresh=force_refresh)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(playlist_ids))) as executor:
+        return dict(zip(playlist_ids, executor.map(_fetch, playlist_ids)))
 
 
 def get_liked_song_uris(sp: spotipy.Spotify) -> list:
@@ -109,25 +264,41 @@ def get_liked_song_uris(sp: spotipy.Spotify) -> list:
     Fetch all liked/saved track URIs via current_user_saved_tracks.
     Use this instead of get_playlist_tracks(LIKED_SONGS_PLAYLIST_ID) since
     Liked Songs is not a real playlist and has no playlist_items endpoint.
+    The first page reports the total, so the remaining pages are requested
+    concurrently (at most settings.PARALLEL_MAX_WORKERS at a time), in order.
     """
-    uris = []
-    offset = 0
     limit = 50
-    while True:
-        page = api.api_call(
+
+    def _fetch(offset):
+        return api.api_call(
             sp.current_user_saved_tracks,
             limit=limit,
             offset=offset,
-        )
-        items = page.get("items", [])
+        ).get("items", [])
+
+    first = api.api_call(sp.current_user_saved_tracks, limit=limit, offset=0)
+    pages = [first.get("items", [])]
+    offsets = list(range(limit, first.get("total") or 0, limit))
+    if len(pages[0]) == limit and offsets:
+        workers = min(settings.PARALLEL_MAX_WORKERS, len(offsets))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages.extend(executor.map(_fetch, offsets))
+        else:
+            pages.extend(_fetch(offset) for offset in offsets)
+    # Keep paging past the reported total if the library grew meanwhile (or total was missing)
+    offset = limit * len(pages)
+    while len(pages[-1]) == limit:
+        pages.append(_fetch(offset))
+        offset += limit
+
+    uris = []
+    for items in pages:
         for it in items:
             t = it.get("track") or {}
             uri = t.get("uri")
             if uri:
                 uris.append(uri)
-        if not items or len(items) < limit:
-            break
-        offset += limit
     return uris
 
 
@@ -140,6 +311,17 @@ def get_user_info(sp: spotipy.Spotify, force_refresh: bool = False) -> dict:
     return _user_cache
 
 
+def _read_parquet_columns(path, columns: list):
+    """Read the given columns (those that exist) of a parquet file as a DataFrame."""
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        df = pd.read_parquet(path)
+        return df[[c for c in columns if c in df.columns]]
+    dataset = ds.dataset(path, format="parquet")
+    return dataset.to_table(columns=[c for c in columns if c in dataset.schema.names]).to_pandas()
+
+
 def _load_genre_data() -> tuple:
     """
     Load genre data from parquet files (artists, track_artists).
@@ -154,8 +336,9 @@ def _load_genre_data() -> tuple:
         if not (track_artists_path.exists() and artists_path.exists()):
             _genre_data_cache = (None, None)
             return (None, None)
-        track_artists = pd.read_parquet(track_artists_path)
-        artists = pd.read_parquet(artists_path)
+        # Only the columns the genre helpers use are decoded
+        track_artists = _read_parquet_columns(track_artists_path, ["track_id", "artist_id", "position"])
+        artists = _read_parquet_columns(artists_path, ["artist_id", "genres"])
         _genre_data_cache = (track_artists, artists)
         return (track_artists, artists)
     except Exception as e:
@@ -164,3 +347,50 @@ def _load_genre_data() -> tuple:
         return (None, None)
 
 
+def _load_liked_songs(columns: list = None):
+    """
+    Load the Liked Songs rows of playlist_tracks.parquet.
+    Uses pyarrow predicate pushdown and column projection so only the liked rows
+    and requested columns (those that exist) are read; falls back to pandas.
+    The read is cached on the file's mtime, so the several steps of one sync share
+    it; each caller gets its own copy.
+    Returns a DataFrame (possibly empty) or None if the file does not exist.
+    """
+    path = settings.DATA_DIR / "playlist_tracks.parquet"
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    liked = _read_liked_songs(
+        str(path),
+        mtime_ns,
+        settings.LIKED_SONGS_PLAYLIST_ID,
+        None if columns is None else tuple(columns),
+    )
+    return liked.copy()
+
+
+@lru_cache(maxsize=4)
+def _read_liked_songs(path: str, mtime_ns: int, liked_id: str, columns: tuple):
+    """Uncached read behind _load_liked_songs (mtime_ns only keys the cache)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        library = pd.read_parquet(path)
+        liked = library[library["playlist_id"].astype(str) == liked_id]
+        if columns is not None:
+            liked = liked[[c for c in columns if c in liked.columns]]
+        return liked.reset_index(drop=True)
+
+    dataset = ds.dataset(path, format="parquet")
+    playlist_id = ds.field("playlist_id")
+    if not pa.types.is_string(dataset.schema.field("playlist_id").type):
+        playlist_id = playlist_id.cast(pa.string())
+    if columns is not None:
+        columns = [c for c in columns if c in dataset.schema.names]
+    table = dataset.to_table(
+        filter=playlist_id == liked_id,
+        columns=columns,
+    )
+    return table.to_pandas()
@@ -4,37 +4,70 @@ Uses description_helpers for build_simple_description and sanitization.
 Updates incrementally: skip playlists whose snapshot_id has not changed.
 """
 
-import json
+import atexit
+import threading
 from pathlib import Path
 
 import spotipy
 
+from src.scripts.common.sidecar import sidecar_path, read_sidecar, write_sidecar
+
 from . import settings
 from . import logger
 from . import api
 from . import catalog
 
-_CACHE_FILENAME = ".description_snapshot_cache.json"
+# Recorded snapshots are kept in memory and written in batches (plus once at the end of
+# a run) instead of rewriting the whole file after every playlist
+_SNAPSHOT_FLUSH_EVERY = 25
+# Descriptions are updated from worker threads; guards the in-memory cache and its file
+_snapshot_cache_lock = threading.Lock()
+_snapshot_cache = None  # (path, {playlist_id: snapshot_id}) once loaded
+_snapshot_cache_pending = 0  # records not yet written to disk
 
 
 def _load_snapshot_cache() -> dict:
-    path = settings.get_sync_data_dir() / _CACHE_FILENAME
-    if not path.exists():
-        return {}
+    """In-memory snapshot cache for the current sync data dir (read from disk once)."""
+    global _snapshot_cache, _snapshot_cache_pending
+    path = sidecar_path(settings.get_sync_data_dir(), "description_snapshot")
+    if _snapshot_cache is None or _snapshot_cache[0] != path:
+        if _snapshot_cache is not None and _snapshot_cache_pending:
+            _save_snapshot_cache(*_snapshot_cache)
+        _snapshot_cache = (path, read_sidecar(path))
+        _snapshot_cache_pending = 0
+    return _snapshot_cache[1]
+
+
+def _save_snapshot_cache(path: Path, cache: dict) -> None:
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {}
+        write_sidecar(path, cache)
+    except OSError as e:
+        logger.verbose_log(f"  Could not save description cache: {e}")
 
 
-def _save_snapshot_cache(cache: dict) -> None:
-    path = settings.get_sync_data_dir() / _CACHE_FILENAME
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(cache, f, indent=0)
-    except Exception as e:
-        logger.verbose_log(f"  Could not save description cache: {e}")
+def _record_snapshot(playlist_id: str, snapshot_id: str) -> None:
+    global _snapshot_cache_pending
+    with _snapshot_cache_lock:
+        cache = _load_snapshot_cache()
+        if cache.get(playlist_id) == snapshot_id:
+            return
+        cache[playlist_id] = snapshot_id
+        _snapshot_cache_pending += 1
+        if _snapshot_cache_pending >= _SNAPSHOT_FLUSH_EVERY:
+            _save_snapshot_cache(*_snapshot_cache)
+            _snapshot_cache_pending = 0
+
+
+def flush_description_snapshot_cache() -> None:
+    """Write snapshot records not yet on disk (called at the end of a sync and at exit)."""
+    global _snapshot_cache_pending
+    with _snapshot_cache_lock:
+        if _snapshot_cache is not None and _snapshot_cache_pending:
+            _save_snapshot_cache(*_snapshot_cache)
+            _snapshot_cache_pending = 0
+
+
+atexit.register(flush_description_snapshot_cache)
 
 
 def _update_playlist_description_with_genres(
@@ -55,8 +88,9 @@ def _update_playlist_description_with_genres(
         playlist_name = pl.get("name", "Unknown")
         snapshot_id = pl.get("snapshot_id") or ""
 
-        cache = _load_snapshot_cache()
-        if snapshot_id and cache.get(playlist_id) == snapshot_id:
+        with _snapshot_cache_lock:
+            cached_snapshot = _load_snapshot_cache().get(playlist_id)
+        if snapshot_id and cached_snapshot == snapshot_id:
             logger.verbose_log(f"  Description '{playlist_name}': unchanged, skipping")
             return False
 
@@ -108,9 +142,7 @@ def _update_playlist_description_with_genres(
                 )
                 logger.verbose_log(f"  ✅ Updated description for playlist '{playlist_name}' ({len(new_description)} chars)")
                 if snapshot_id:
-                    cache = _load_snapshot_cache()
-                    cache[playlist_id] = snapshot_id
-                    _save_snapshot_cache(cache)
+                    _record_snapshot(playlist_id, snapshot_id)
                 return True
             except UnicodeEncodeError as e:
                 logger.verbose_log(f"  ⚠️  Invalid encoding in description for '{playlist_name}': {e}")
@@ -133,9 +165,7 @@ def _update_playlist_description_with_genres(
                 logger.verbose_log(f"  Description repr (first 200): {repr(new_description[:200])}")
                 return False
         if snapshot_id:
-            cache = _load_snapshot_cache()
-            cache[playlist_id] = snapshot_id
-            _save_snapshot_cache(cache)
+            _record_snapshot(playlist_id, snapshot_id)
         return False
     except Exception as e:
         logger.verbose_log(f"  Failed to update description: {e}")
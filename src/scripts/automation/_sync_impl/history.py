@@ -34,7 +34,7 @@ def get_most_played_tracks(
         return []
 
     track_stats = (
-        month_data.groupby(track_col)
+        month_data.groupby(track_col, observed=True)
         .agg({"ms_played": ["count", "sum"]})
         .reset_index()
     )
@@ -100,7 +100,7 @@ def get_time_based_tracks(
         return []
 
     track_stats = (
-        filtered.groupby(track_col)
+        filtered.groupby(track_col, observed=True)
         .agg({"ms_played": ["count", "sum"]})
         .reset_index()
     )
@@ -140,7 +140,7 @@ def get_repeat_tracks(
         return []
 
     play_counts = (
-        month_data.groupby(track_col).size().reset_index(name="play_count")
+        month_data.groupby(track_col, observed=True).size().reset_index(name="play_count")
     )
     repeat_tracks = play_counts[play_counts["play_count"] >= min_repeats].copy()
     repeat_tracks = repeat_tracks.sort_values("play_count", ascending=False)
@@ -177,8 +177,7 @@ def get_discovery_tracks(
         if not before_month.empty and track_col in before_month.columns:
             known_tracks = set(before_month[track_col].dropna().unique())
 
-        month_tracks = month_data[track_col].dropna().unique()
-        new_tracks = [uri for uri in month_tracks if uri not in known_tracks]
+        new_tracks = set(month_data[track_col].dropna().unique()) - known_tracks
 
         first_plays = month_data[
             month_data[track_col].isin(new_tracks)
@@ -8,7 +8,8 @@ updates can use cached results. Uses Spotify preview URLs only.
 import spotipy
 
 from .logger import log, verbose_log
-from .settings import get_sync_data_dir, LIKED_SONGS_PLAYLIST_ID
+from .settings import get_sync_data_dir
+from .catalog import _load_liked_songs
 from .tracks import _get_preview_urls_for_tracks
 
 
@@ -30,16 +31,14 @@ def run_mood_inference_on_sync(sp: spotipy.Spotify) -> None:
     if not pt_path.exists():
         log(f"  Mood inference: skipped (playlist_tracks.parquet not found at {pt_path})")
         return
-    import pandas as _pd
-    library = _pd.read_parquet(pt_path)
-    liked = library[library["playlist_id"].astype(str) == LIKED_SONGS_PLAYLIST_ID]
-    if liked.empty:
+    liked = _load_liked_songs(columns=["track_uri", "track_id"])
+    if liked is None or liked.empty:
         log("  Mood inference: skipped (no liked tracks in library)")
         return
     if "track_uri" in liked.columns:
-        track_uris = liked["track_uri"].dropna().unique().tolist()
+        track_uris = list(liked["track_uri"].dropna().unique())
     else:
-        track_uris = [f"spotify:track:{tid}" for tid in liked["track_id"].dropna().unique().tolist()]
+        track_uris = [f"spotify:track:{tid}" for tid in liked["track_id"].dropna().unique()]
     if not track_uris:
         log("  Mood inference: skipped (no track URIs)")
         return
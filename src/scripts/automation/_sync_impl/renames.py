@@ -5,6 +5,10 @@ Handles migration from old prefix names to new configuration and fixes
 incorrectly named yearly genre playlists.
 """
 
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
 import spotipy
 
 from .logger import log
@@ -17,6 +21,54 @@ from .catalog import (
 from .api import api_call
 
 
+def _match_prefix_case(old_prefix: str, new_prefix: str) -> str:
+    """Apply old_prefix's capitalization style to new_prefix."""
+    if old_prefix.isupper():
+        return new_prefix.upper()
+    if old_prefix.islower():
+        return new_prefix.lower()
+    if old_prefix[0].isupper():
+        return new_prefix.title() if len(new_prefix) > 1 else new_prefix.upper()
+    return new_prefix
+
+
+@lru_cache(maxsize=1)
+def _build_prefix_mapping(prefix_monthly: str, prefix_most_played: str, prefix_discovery: str) -> tuple:
+    """
+    Map old prefixes to their (case-matched) replacements for the given configuration.
+    Returns (old_to_new, pattern), where pattern is a compiled alternation of the old
+    prefixes, longest first, that does not match inside a longer word ("Top" in
+    "Topic"), or (empty mapping, None) if no prefix changed. Built once per prefix
+    configuration; the mapping is read-only since the result is shared.
+    """
+    old_to_new = {}
+
+    if prefix_monthly != "Auto" and prefix_monthly != "auto":
+        old_to_new["Auto"] = prefix_monthly
+        old_to_new["auto"] = prefix_monthly.lower()
+        old_to_new["AUTO"] = prefix_monthly.upper()
+
+    if prefix_most_played != "Top":
+        old_to_new["Top"] = prefix_most_played
+
+    if prefix_discovery not in ["Discover", "Discovery", "Dscvr"]:
+        old_to_new["Discover"] = prefix_discovery
+        old_to_new["Discovery"] = prefix_discovery
+
+    if not old_to_new:
+        return MappingProxyType({}), None
+
+    old_to_new = MappingProxyType(
+        {old: _match_prefix_case(old, new) for old, new in old_to_new.items()}
+    )
+    # A lowercase letter right after the match means it is part of a word; names built
+    # from the templates follow the prefix with a capitalized month, digit or space
+    pattern = re.compile(
+        "(?:" + "|".join(map(re.escape, sorted(old_to_new, key=len, reverse=True))) + ")(?![a-z])"
+    )
+    return old_to_new, pattern
+
+
 def rename_playlists_with_old_prefixes(sp: spotipy.Spotify) -> None:
     """Rename playlists that use old prefixes to match new prefix configuration.
 
@@ -29,19 +81,7 @@ def rename_playlists_with_old_prefixes(sp: spotipy.Spotify) -> None:
     user = get_user_info(sp)
     user_id = user["id"]
 
-    old_to_new = {}
-
-    if PREFIX_MONTHLY != "Auto" and PREFIX_MONTHLY != "auto":
-        old_to_new["Auto"] = PREFIX_MONTHLY
-        old_to_new["auto"] = PREFIX_MONTHLY.lower()
-        old_to_new["AUTO"] = PREFIX_MONTHLY.upper()
-
-    if PREFIX_MOST_PLAYED != "Top":
-        old_to_new["Top"] = PREFIX_MOST_PLAYED
-
-    if PREFIX_DISCOVERY not in ["Discover", "Discovery", "Dscvr"]:
-        old_to_new["Discover"] = PREFIX_DISCOVERY
-        old_to_new["Discovery"] = PREFIX_DISCOVERY
+    old_to_new, pattern = _build_prefix_mapping(PREFIX_MONTHLY, PREFIX_MOST_PLAYED, PREFIX_DISCOVERY)
 
     if not old_to_new:
         log("  ℹ️  No prefix changes detected - skipping rename")
@@ -50,52 +90,34 @@ def rename_playlists_with_old_prefixes(sp: spotipy.Spotify) -> None:
     renamed_count = 0
 
     for old_name, playlist_id in list(existing.items()):
-        new_name = None
-
-        for old_prefix, new_prefix in old_to_new.items():
-            if old_prefix in old_name:
-                prefix_start = old_name.find(old_prefix)
-                if prefix_start == -1:
-                    continue
-                prefix_end = prefix_start + len(old_prefix)
-                before_prefix = old_name[:prefix_start]
-                suffix = old_name[prefix_end:]
-
-                if old_prefix.isupper():
-                    new_prefix_used = new_prefix.upper()
-                elif old_prefix.islower():
-                    new_prefix_used = new_prefix.lower()
-                elif old_prefix[0].isupper():
-                    new_prefix_used = (
-                        new_prefix.title() if len(new_prefix) > 1 else new_prefix.upper()
-                    )
-                else:
-                    new_prefix_used = new_prefix
-
-                new_name = f"{before_prefix}{new_prefix_used}{suffix}"
-
-                if new_name != old_name and new_name not in existing:
-                    try:
-                        api_call(
-                            sp.user_playlist_change_details,
-                            user_id,
-                            playlist_id,
-                            name=new_name,
-                        )
-                        log(f"  ✅ Renamed: '{old_name}' -> '{new_name}'")
-                        renamed_count += 1
-                        _invalidate_playlist_cache()
-                        existing[new_name] = playlist_id
-                        del existing[old_name]
-                    except Exception as e:
-                        log(f"  ⚠️  Failed to rename '{old_name}': {e}")
-                elif new_name in existing:
-                    log(
-                        f"  ⚠️  Skipped '{old_name}' -> '{new_name}' (target name already exists)"
-                    )
-                break
+        # Only the first old prefix is replaced; longest wins where they overlap
+        new_name = pattern.sub(lambda m: old_to_new[m.group(0)], old_name, count=1)
+        if new_name == old_name:
+            continue
+
+        # Only a playlist with exactly this name blocks the rename (Spotify allows
+        # names that differ only in case), not the map's case-insensitive match
+        if not existing.has_exact(new_name):
+            try:
+                api_call(
+                    sp.user_playlist_change_details,
+                    user_id,
+                    playlist_id,
+                    name=new_name,
+                )
+                log(f"  ✅ Renamed: '{old_name}' -> '{new_name}'")
+                renamed_count += 1
+                existing[new_name] = playlist_id
+                del existing[old_name]
+            except Exception as e:
+                log(f"  ⚠️  Failed to rename '{old_name}': {e}")
+        else:
+            log(
+                f"  ⚠️  Skipped '{old_name}' -> '{new_name}' (target name already exists)"
+            )
 
     if renamed_count > 0:
+        _invalidate_playlist_cache()
         log(f"  ✅ Renamed {renamed_count} playlist(s)")
     else:
         log("  ℹ️  No playlists needed renaming")
@@ -43,6 +43,7 @@ SPOTIFY_MAX_DESCRIPTION_LENGTH = config.SPOTIFY_MAX_DESCRIPTION_LENGTH
 MOOD_MAX_TAGS = config.MOOD_MAX_TAGS
 DEFAULT_DISCOVERY_TRACK_LIMIT = config.DEFAULT_DISCOVERY_TRACK_LIMIT
 PARALLEL_MIN_TRACKS = getattr(config, "PARALLEL_MIN_TRACKS", 50)
+PARALLEL_MAX_WORKERS = getattr(config, "PARALLEL_MAX_WORKERS", 8)
 
 
 def get_sync_data_dir() -> Path:
@@ -21,10 +21,14 @@ def _to_uri(track_id: str) -> str:
     return track_id
 
 
+_TRACK_URI_PREFIX = "spotify:track:"
+_TRACK_URI_PREFIX_LEN = len(_TRACK_URI_PREFIX)
+
+
 def _uri_to_track_id(track_uri: str) -> str:
     """Extract track ID from track URI."""
-    if track_uri.startswith("spotify:track:"):
-        return track_uri.replace("spotify:track:", "")
+    if track_uri.startswith(_TRACK_URI_PREFIX):
+        return track_uri[_TRACK_URI_PREFIX_LEN:]
     return track_uri
 
 
@@ -63,8 +67,12 @@ def _get_preview_urls_for_tracks(sp: spotipy.Spotify, track_uris: list) -> dict:
 
     if not track_uris:
         return {}
-    track_ids = [_uri_to_track_id(u) for u in track_uris if u and "spotify:track:" in str(u)]
-    track_ids = list(dict.fromkeys(track_ids))
+    # Slice off the fixed prefix (no split/replace per URI); dict.fromkeys keeps first-seen order
+    track_ids = list(dict.fromkeys(
+        u[_TRACK_URI_PREFIX_LEN:]
+        for u in track_uris
+        if isinstance(u, str) and u.startswith(_TRACK_URI_PREFIX)
+    ))
     preview_urls = {}
     chunks = list(_chunked(track_ids, 50))
     for i, chunk in enumerate(chunks):
@@ -101,31 +109,47 @@ def _get_audio_features_for_tracks(sp: spotipy.Spotify, track_uris: list) -> lis
 
 def _get_all_track_genres(track_id: str, track_artists, artist_genres_map: dict) -> list:
     """Get all genres from all artists on a track."""
-    track_artist_rows = track_artists[track_artists["track_id"] == track_id]
+    artist_ids = track_artists["artist_id"].to_numpy()[track_artists["track_id"].to_numpy() == track_id]
+    # Called once per track: bind the per-iteration methods outside the loops
     all_genres = []
-    for _, row in track_artist_rows.iterrows():
-        artist_id = row["artist_id"]
-        artist_genres = _parse_genres(artist_genres_map.get(artist_id, []))
-        all_genres.extend(artist_genres)
+    extend_genres = all_genres.extend
+    genres_of = artist_genres_map.get
+    for artist_id in artist_ids:
+        extend_genres(_parse_genres(genres_of(artist_id, [])))
     seen = set()
+    seen_add = seen.add
     unique_genres = []
+    append_genre = unique_genres.append
     for genre in all_genres:
         if genre not in seen:
-            seen.add(genre)
-            unique_genres.append(genre)
+            seen_add(genre)
+            append_genre(genre)
     return unique_genres
 
 
+def _primary_artist_map(track_artists) -> dict:
+    """
+    Map track_id -> primary artist_id in one pass over track_artists: the first
+    position-0 row for each track, else its first row (as _get_primary_artist_genres picks).
+    """
+    ordered = track_artists
+    if "position" in track_artists.columns:
+        ordered = track_artists.sort_values("position", key=lambda p: p != 0, kind="stable")
+    first = ordered.drop_duplicates("track_id", keep="first")
+    return dict(zip(first["track_id"].to_numpy(), first["artist_id"].to_numpy()))
+
+
+# (track_artists frame, its primary-artist map); per-track callers reuse the map
+_primary_artist_cache = (None, None)
+
+
 def _get_primary_artist_genres(track_id: str, track_artists, artist_genres_map: dict) -> list:
     """Get genres from the primary (first) artist only for a track."""
-    track_artist_rows = track_artists[track_artists["track_id"] == track_id]
-    if track_artist_rows.empty:
+    global _primary_artist_cache
+    cached_frame, primary_artists = _primary_artist_cache
+    if cached_frame is not track_artists:
+        primary_artists = _primary_artist_map(track_artists)
+        _primary_artist_cache = (track_artists, primary_artists)
+    if track_id not in primary_artists:
         return []
-    if "position" in track_artist_rows.columns:
-        primary = track_artist_rows[track_artist_rows["position"] == 0]
-        if primary.empty:
-            primary = track_artist_rows.head(1)
-    else:
-        primary = track_artist_rows.head(1)
-    artist_id = primary["artist_id"].iloc[0]
-    return _parse_genres(artist_genres_map.get(artist_id, []))
+    return _parse_genres(artist_genres_map.get(primary_artists[track_id], []))
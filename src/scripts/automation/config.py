@@ -122,7 +122,8 @@ SPOTIFY_API_MAX_PLAYLIST_ITEMS = 100
 SPOTIFY_API_PAGINATION_LIMIT = 50
 
 # Rate limiting
-API_RATE_LIMIT_DELAY = 0.1  # Base delay between API calls (seconds)
+API_RATE_LIMIT_DELAY = 0.1  # Average interval between API calls, process-wide (seconds; 10 req/s)
+API_RATE_LIMIT_BURST = 20  # Calls allowed back-to-back after an idle period
 API_RATE_LIMIT_BACKOFF_MULTIPLIER = 1.5  # Multiplier for backoff on rate errors
 API_RATE_LIMIT_MAX_RETRIES = 6  # Maximum retry attempts for rate-limited requests
 API_RATE_LIMIT_INITIAL_DELAY = 1.0  # Initial delay on rate limit (seconds)
@@ -18,6 +18,18 @@ import random
 from .sync import DATA_DIR, log, verbose_log, get_existing_playlists, get_user_info, api_call
 
 
+def _load_artist_genres_map() -> Dict[str, list]:
+    """{artist_id: genres} read straight from the two Arrow columns (no DataFrame/index)."""
+    path = DATA_DIR / "artists.parquet"
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        artists_df = pd.read_parquet(path, columns=["artist_id", "genres"])
+        return dict(zip(artists_df["artist_id"].to_numpy(), artists_df["genres"].to_numpy()))
+    table = pq.read_table(path, columns=["artist_id", "genres"])
+    return dict(zip(table.column("artist_id").to_pylist(), table.column("genres").to_pylist()))
+
+
 def generate_theme_playlist(
     sp: spotipy.Spotify,
     theme: str,
@@ -92,7 +104,7 @@ def generate_theme_playlist(
     try:
         tracks_df = pd.read_parquet(DATA_DIR / "tracks.parquet")
         playlist_tracks_df = pd.read_parquet(DATA_DIR / "playlist_tracks.parquet")
-        artists_df = pd.read_parquet(DATA_DIR / "artists.parquet")
+        artist_genres_map = _load_artist_genres_map()
     except Exception as e:
         log(f"  ⚠️  Could not load data: {e}")
         return None
@@ -114,32 +126,26 @@ def generate_theme_playlist(
     if "target_genres" in config:
         # Get genres for tracks
         track_artists_df = pd.read_parquet(DATA_DIR / "track_artists.parquet")
-        artist_genres_map = artists_df.set_index("artist_id")["genres"].to_dict()
         
-        matching_tracks = []
-        for _, row in merged.iterrows():
-            track_id = row["track_id"]
-            # Get genres from track or artists
-            track_genres = []
-            if "genres" in row and pd.notna(row["genres"]):
-                if isinstance(row["genres"], list):
-                    track_genres = row["genres"]
-            
-            # Also check artist genres
-            track_artists = track_artists_df[track_artists_df["track_id"] == track_id]
-            for _, ta_row in track_artists.iterrows():
-                artist_id = ta_row["artist_id"]
-                if artist_id in artist_genres_map:
-                    artist_genres = artist_genres_map[artist_id]
-                    if isinstance(artist_genres, list):
-                        track_genres.extend(artist_genres)
-            
-            # Check if matches target genres (use raw artist/track genres)
-            if any(genre in config["target_genres"] for genre in track_genres):
-                matching_tracks.append(row)
+        target_genres = set(config["target_genres"])
+        
+        # Track-level genres: explode list cells once and test membership in C
+        track_match = pd.Series(False, index=merged.index)
+        if "genres" in merged.columns:
+            track_genres = merged["genres"].dropna().explode()
+            track_match = track_genres.isin(target_genres).groupby(level=0).any()
+            track_match = track_match.reindex(merged.index, fill_value=False)
+        
+        # Artist-level genres: one exploded (track_id, genre) table instead of a per-row scan
+        artist_genres = track_artists_df[["track_id", "artist_id"]].assign(
+            genre=track_artists_df["artist_id"].map(artist_genres_map)
+        ).explode("genre")
+        artist_match_ids = artist_genres.loc[artist_genres["genre"].isin(target_genres), "track_id"]
+        
+        matching_tracks = merged[track_match | merged["track_id"].isin(artist_match_ids)]
         
-        if matching_tracks:
-            merged = pd.DataFrame(matching_tracks)
+        if not matching_tracks.empty:
+            merged = matching_tracks
         else:
             log(f"  ⚠️  No tracks match theme criteria")
             return None
@@ -368,11 +374,12 @@ def smart_mix_playlists(
         return None
     
     # Find playlists
+    first_by_name = playlists_df.drop_duplicates("name", keep="first")
+    id_by_name = dict(zip(first_by_name["name"].to_numpy(), first_by_name["playlist_id"].to_numpy()))
     playlist_ids = []
     for name in playlist_names:
-        matches = playlists_df[playlists_df["name"] == name]
-        if not matches.empty:
-            playlist_ids.append(matches.iloc[0]["playlist_id"])
+        if name in id_by_name:
+            playlist_ids.append(id_by_name[name])
         else:
             log(f"  ⚠️  Playlist '{name}' not found")
     
@@ -384,19 +391,26 @@ def smart_mix_playlists(
     all_tracks = []
     playlist_track_counts = {}
     
+    # One groupby over the selected playlists instead of a scan per playlist
+    selected_rows = playlist_tracks_df[playlist_tracks_df["playlist_id"].isin(playlist_ids)]
+    tracks_by_pid = selected_rows.groupby("playlist_id", sort=False)["track_id"].unique().to_dict()
     for pid in playlist_ids:
-        tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == pid]
-        track_list = tracks["track_id"].unique().tolist()
+        track_list = list(tracks_by_pid.get(pid, ()))
         playlist_track_counts[pid] = len(track_list)
         all_tracks.extend([(tid, pid) for tid in track_list])
     
-    # Remove duplicates (keep first occurrence)
+    # Remove duplicates (keep first occurrence), bucketing each kept track by playlist
     seen = set()
+    seen_add = seen.add
     unique_tracks = []
+    append_unique = unique_tracks.append
+    unique_by_pid = {}
+    pid_bucket = unique_by_pid.setdefault
     for tid, pid in all_tracks:
         if tid not in seen:
-            seen.add(tid)
-            unique_tracks.append((tid, pid))
+            seen_add(tid)
+            append_unique((tid, pid))
+            pid_bucket(pid, []).append(tid)
     
     # Apply mixing strategy
     if mix_strategy == "balanced":
@@ -404,8 +418,7 @@ def smart_mix_playlists(
         tracks_per_playlist = len(unique_tracks) // len(playlist_ids)
         selected = []
         for pid in playlist_ids:
-            pid_tracks = [tid for tid, p in unique_tracks if p == pid]
-            selected.extend(pid_tracks[:tracks_per_playlist])
+            selected.extend(unique_by_pid.get(pid, [])[:tracks_per_playlist])
     elif mix_strategy == "weighted":
         # Weight by playlist size
         total_tracks = sum(playlist_track_counts.values())
@@ -413,8 +426,7 @@ def smart_mix_playlists(
         for pid in playlist_ids:
             weight = playlist_track_counts[pid] / total_tracks
             count = int(len(unique_tracks) * weight)
-            pid_tracks = [tid for tid, p in unique_tracks if p == pid]
-            selected.extend(pid_tracks[:count])
+            selected.extend(unique_by_pid.get(pid, [])[:count])
     elif mix_strategy == "shuffled":
         # Random mix
         selected = [tid for tid, _ in unique_tracks]
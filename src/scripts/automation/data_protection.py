@@ -25,7 +25,8 @@ def _get_backup_dir() -> Path:
 def create_playlist_backup(
     sp: spotipy.Spotify,
     playlist_id: str,
-    playlist_name: str
+    playlist_name: str,
+    tracks: Optional[set] = None
 ) -> Optional[Path]:
     """
     Create a backup of a playlist before destructive operations.
@@ -34,6 +35,7 @@ def create_playlist_backup(
         sp: Spotify client
         playlist_id: Playlist ID to backup
         playlist_name: Playlist name (for backup filename)
+        tracks: Optional freshly fetched track URIs (skips re-fetching them)
 
     Returns:
         Path to backup file, or None if backup failed
@@ -41,7 +43,8 @@ def create_playlist_backup(
     from .sync import api_call, log, verbose_log, get_playlist_tracks
     try:
         # Get all tracks
-        tracks = get_playlist_tracks(sp, playlist_id, force_refresh=True)
+        if tracks is None:
+            tracks = get_playlist_tracks(sp, playlist_id, force_refresh=True)
 
         # Get playlist metadata
         pl = api_call(sp.playlist, playlist_id, fields="name,description,public,collaborative")
@@ -213,7 +216,7 @@ def safe_remove_tracks_from_playlist(
 
         # Create backup if requested
         if create_backup and tracks_to_remove:
-            backup_file = create_playlist_backup(sp, playlist_id, playlist_name)
+            backup_file = create_playlist_backup(sp, playlist_id, playlist_name, tracks=before_tracks)
 
         # Remove tracks
         if tracks_to_remove:
@@ -221,8 +224,7 @@ def safe_remove_tracks_from_playlist(
                 api_call(sp.playlist_remove_all_occurrences_of_items, playlist_id, chunk)
 
             # Invalidate cache
-            if playlist_id in _playlist_tracks_cache:
-                del _playlist_tracks_cache[playlist_id]
+            _playlist_tracks_cache.pop(playlist_id, None)
 
         # Validate after removal
         if validate_after:
@@ -253,7 +255,9 @@ def safe_delete_playlist(
     playlist_id: str,
     playlist_name: str,
     create_backup: bool = True,
-    verify_tracks_preserved_in: Optional[str] = None
+    verify_tracks_preserved_in: Optional[str] = None,
+    preserved_tracks: Optional[set] = None,
+    tracks: Optional[set] = None
 ) -> Tuple[bool, Optional[Path]]:
     """
     Safely delete a playlist with backup and verification.
@@ -264,6 +268,10 @@ def safe_delete_playlist(
         playlist_name: Playlist name (for logging/backup)
         create_backup: If True, create backup before deletion
         verify_tracks_preserved_in: Optional playlist ID to verify tracks are preserved there
+        preserved_tracks: Optional freshly fetched tracks of verify_tracks_preserved_in;
+            lets callers deleting several playlists into one target fetch it once
+        tracks: Optional freshly fetched track URIs of the playlist being deleted
+            (skips re-fetching them for the backup and verification)
     
     Returns:
         Tuple of (success, backup_file_path)
@@ -273,15 +281,18 @@ def safe_delete_playlist(
 
     try:
         # Get tracks before deletion
-        tracks_before = get_playlist_tracks(sp, playlist_id, force_refresh=True)
+        tracks_before = tracks
+        if tracks_before is None:
+            tracks_before = get_playlist_tracks(sp, playlist_id, force_refresh=True)
 
         # Create backup if requested
         if create_backup:
-            backup_file = create_playlist_backup(sp, playlist_id, playlist_name)
+            backup_file = create_playlist_backup(sp, playlist_id, playlist_name, tracks=tracks_before)
 
         # Verify tracks are preserved in another playlist if specified
         if verify_tracks_preserved_in:
-            preserved_tracks = get_playlist_tracks(sp, verify_tracks_preserved_in, force_refresh=True)
+            if preserved_tracks is None:
+                preserved_tracks = get_playlist_tracks(sp, verify_tracks_preserved_in, force_refresh=True)
             missing_tracks = tracks_before - preserved_tracks
             if missing_tracks:
                 log(f"  ⚠️  WARNING: {len(missing_tracks)} tracks from '{playlist_name}' are NOT in target playlist!")
@@ -4,9 +4,11 @@ Playlist formatting utilities.
 Functions for formatting playlist names and descriptions.
 
 Note: All config values are accessed via the config module at call time (not import time)
-so that reload_from_env() is respected.
+so that reload_from_env() is respected. Cached name/description formatting keys on those values.
 """
 
+from functools import lru_cache
+
 from . import config as _config
 
 
@@ -101,6 +103,31 @@ def format_playlist_name(
     Returns:
         Formatted playlist name
     """
+    return _format_playlist_name_cached(
+        template, month_str, genre, prefix, playlist_type, year, _name_config_key()
+    )
+
+
+def _name_config_key() -> tuple:
+    """Config values that affect playlist names (read at call time; part of the cache key)."""
+    return (
+        _config.OWNER_NAME, _config.BASE_PREFIX,
+        _config.PREFIX_MONTHLY, _config.PREFIX_YEARLY, _config.PREFIX_MOST_PLAYED, _config.PREFIX_DISCOVERY,
+        _config.DATE_FORMAT, _config.SEPARATOR_MONTH, _config.SEPARATOR_PREFIX, _config.CAPITALIZATION,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _format_playlist_name_cached(
+    template: str,
+    month_str: str,
+    genre: str,
+    prefix: str,
+    playlist_type: str,
+    year: str,
+    config_key: tuple,
+) -> str:
+    """Body of format_playlist_name, memoized on its arguments plus the name config."""
     # Determine prefix based on playlist type if not provided (genre support removed)
     if prefix is None:
         prefix_map = {
@@ -207,7 +234,22 @@ def format_playlist_description(
     Returns:
         Formatted description string
     """
-    return _config.DESCRIPTION_TEMPLATE.format(
+    return _format_playlist_description_cached(
+        description, period, date, playlist_type, genre, _config.DESCRIPTION_TEMPLATE
+    )
+
+
+@lru_cache(maxsize=256)
+def _format_playlist_description_cached(
+    description: str,
+    period: str,
+    date: str,
+    playlist_type: str,
+    genre: str,
+    template: str,
+) -> str:
+    """Body of format_playlist_description, memoized on its arguments plus the template."""
+    return template.format(
         description=description or "",
         period=period or "",
         date=date or "",
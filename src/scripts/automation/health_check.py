@@ -113,7 +113,7 @@ def main():
     tracks_df = pd.read_parquet(tracks_path)
     
     # Filter to owned playlists only
-    owned_playlists = playlists_df[playlists_df.get("is_owned", False) == True].copy()
+    owned_playlists = playlists_df.loc[playlists_df["is_owned"].to_numpy(dtype=bool, na_value=False)].copy()
     
     logger.info(f"Analyzing {len(owned_playlists)} owned playlists...")
     
@@ -149,17 +149,17 @@ def main():
     if run_all or args.duplicates:
         logger.info("\n" + "="*60)
         logger.info("Checking for duplicate tracks...")
-        from src.scripts.automation.playlist_organization import find_duplicate_tracks_in_playlist
+        from src.scripts.automation.playlist_organization import count_duplicate_tracks_by_playlist
         
-        total_duplicates = 0
-        playlists_with_dups = []
-        for _, playlist in owned_playlists.iterrows():
-            dups = find_duplicate_tracks_in_playlist(
-                playlist_tracks_df, playlist["playlist_id"]
-            )
-            if dups:
-                total_duplicates += len(dups)
-                playlists_with_dups.append((playlist["name"], len(dups)))
+        # One groupby over all playlist tracks instead of a filter per playlist
+        dup_counts = count_duplicate_tracks_by_playlist(playlist_tracks_df).reindex(
+            owned_playlists["playlist_id"].to_numpy(), fill_value=0
+        ).to_numpy()
+        has_dups = dup_counts > 0
+        total_duplicates = int(dup_counts.sum())
+        playlists_with_dups = list(zip(
+            owned_playlists["name"][has_dups].tolist(), dup_counts[has_dups].tolist()
+        ))
         
         if playlists_with_dups:
             logger.warning(f"Found {total_duplicates} duplicate track(s) across {len(playlists_with_dups)} playlist(s):")
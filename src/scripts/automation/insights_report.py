@@ -87,7 +87,7 @@ def main():
         report += "🏥 PLAYLIST HEALTH SCORES\n"
         report += "-" * 70 + "\n"
         
-        owned_playlists = playlists_df[playlists_df.get("is_owned", False) == True]
+        owned_playlists = playlists_df.loc[playlists_df["is_owned"].to_numpy(dtype=bool, na_value=False)]
         
         health_scores = []
         for _, playlist in owned_playlists.head(20).iterrows():  # Top 20
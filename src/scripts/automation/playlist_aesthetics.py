@@ -5,25 +5,74 @@ Enhances playlists with rich descriptions, statistics, and organizational featur
 """
 
 import spotipy
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
-from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
 from .sync import DATA_DIR, api_call, log, verbose_log
 from .formatting import format_playlist_description
 
+# Statistics cache keyed by playlist_id for one (tracks_df, playlist_tracks_df) pair.
+# The frames are held so their ids cannot be reused; passing other frames resets it.
+# Callers must not mutate tracks_df / playlist_tracks_df in place between calls.
+_STATS_CACHE_MAXSIZE = 4096
+_stats_cache_frames = None
+_playlist_stats_cache = {}
+
+
+class _TrackSchema(NamedTuple):
+    """Which optional track columns are present (computed once per tracks_df)."""
+    has_duration: bool
+    has_popularity: bool
+    has_primary_artist: bool
+    has_release_year: bool
+    has_genres: bool
+
+
+def _track_schema(tracks_df: pd.DataFrame) -> _TrackSchema:
+    """Build the column-presence flags for a tracks dataframe."""
+    columns = set(tracks_df.columns)
+    return _TrackSchema(
+        has_duration="duration_ms" in columns,
+        has_popularity="popularity" in columns,
+        has_primary_artist="primary_artist" in columns,
+        has_release_year="release_year" in columns,
+        has_genres="genres" in columns,
+    )
+
+
+def _count_duplicated_tracks(track_ids: pd.Series) -> int:
+    """
+    Count distinct track IDs that appear more than once.
+    
+    Factorizes to dense integer codes and counts them with a single
+    ``np.bincount`` pass instead of ``value_counts()`` plus a boolean filter.
+    """
+    codes, _ = pd.factorize(track_ids)
+    codes = codes[codes >= 0]  # factorize marks missing IDs as -1
+    if codes.size == 0:
+        return 0
+    return int(np.count_nonzero(np.bincount(codes) > 1))
+
 
 def get_playlist_statistics(
     sp: spotipy.Spotify,
     playlist_id: str,
     tracks_df: pd.DataFrame,
-    playlist_tracks_df: pd.DataFrame
+    playlist_tracks_df: pd.DataFrame,
+    schema: Optional[_TrackSchema] = None
 ) -> Dict[str, any]:
     """
     Calculate comprehensive statistics for a playlist.
     
+    Results are memoized per playlist_id for the most recent pair of
+    DataFrames, which must not be mutated in place between calls. When computing
+    stats for many playlists, build ``schema`` once with ``_track_schema``
+    and pass it to skip the per-call column checks.
+    
     Returns:
         Dictionary with statistics including:
         - total_tracks: Number of tracks
@@ -34,66 +83,116 @@ def get_playlist_statistics(
         - year_range: (min_year, max_year) of track releases
         - genres: Genre distribution
     """
+    global _stats_cache_frames
+    frames = _stats_cache_frames
+    if frames is None or frames[0] is not tracks_df or frames[1] is not playlist_tracks_df:
+        _stats_cache_frames = (tracks_df, playlist_tracks_df)
+        _playlist_stats_cache.clear()
+    cached = _playlist_stats_cache.get(playlist_id)
+    if cached is None:
+        if schema is None:
+            schema = _track_schema(tracks_df)
+        cached = _compute_playlist_statistics(playlist_id, tracks_df, playlist_tracks_df, schema)
+        if len(_playlist_stats_cache) >= _STATS_CACHE_MAXSIZE:
+            _playlist_stats_cache.pop(next(iter(_playlist_stats_cache)))
+        _playlist_stats_cache[playlist_id] = cached
+    # Callers get their own top-level dict; the nested top_artists / genres dicts
+    # are shared with the cache and must be treated as read-only
+    return dict(cached)
+
+
+def _compute_playlist_statistics(
+    playlist_id: str,
+    tracks_df: pd.DataFrame,
+    playlist_tracks_df: pd.DataFrame,
+    schema: _TrackSchema
+) -> Dict[str, any]:
+    """Uncached body of get_playlist_statistics."""
     # Get tracks in this playlist
     playlist_tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
     if playlist_tracks.empty:
-        return {
-            "total_tracks": 0,
-            "total_duration_ms": 0,
-            "total_duration_hours": 0.0,
-            "avg_popularity": 0,
-            "top_artists": [],
-            "year_range": (None, None),
-            "genres": {}
-        }
-    
-    # Merge with track data
-    merged = playlist_tracks.merge(tracks_df, on="track_id", how="left")
-    
-    # Basic stats
-    total_tracks = len(merged)
-    total_duration_ms = merged["duration_ms"].sum() if "duration_ms" in merged.columns else 0
-    total_duration_hours = total_duration_ms / (1000 * 60 * 60)
+        return _empty_statistics()
     
-    # Popularity
-    avg_popularity = merged["popularity"].mean() if "popularity" in merged.columns else 0
+    columns, aggregators = _stats_plan(schema)
     
-    # Top artists (by track count)
-    if "primary_artist" in merged.columns:
-        top_artists = merged["primary_artist"].value_counts().head(5).to_dict()
-    else:
-        top_artists = {}
-    
-    # Year range
-    if "release_year" in merged.columns:
-        years = merged["release_year"].dropna()
-        if not years.empty:
-            year_range = (int(years.min()), int(years.max()))
-        else:
-            year_range = (None, None)
-    else:
-        year_range = (None, None)
-    
-    # Genres (from track genres if available)
-    genres = {}
-    if "genres" in merged.columns:
-        all_genres = []
-        for genre_list in merged["genres"].dropna():
-            if isinstance(genre_list, list):
-                all_genres.extend(genre_list)
-        genres = dict(Counter(all_genres).most_common(10))
+    # Merge with only the track columns this schema's aggregators read
+    merged = playlist_tracks[["track_id"]].merge(
+        tracks_df[list(columns)], on="track_id", how="left"
+    )
     
+    stats = _empty_statistics()
+    stats["total_tracks"] = len(merged)
+    stats["top_artists"] = {}
+    for aggregate in aggregators:
+        stats.update(aggregate(merged))
+    return stats
+
+
+def _empty_statistics() -> Dict[str, any]:
+    return {
+        "total_tracks": 0,
+        "total_duration_ms": 0,
+        "total_duration_hours": 0.0,
+        "avg_popularity": 0,
+        "top_artists": [],
+        "year_range": (None, None),
+        "genres": {}
+    }
+
+
+def _agg_duration(merged: pd.DataFrame) -> Dict[str, any]:
+    total_duration_ms = merged["duration_ms"].sum()
     return {
-        "total_tracks": total_tracks,
         "total_duration_ms": int(total_duration_ms),
-        "total_duration_hours": round(total_duration_hours, 1),
-        "avg_popularity": round(avg_popularity, 1),
-        "top_artists": top_artists,
-        "year_range": year_range,
-        "genres": genres
+        "total_duration_hours": round(total_duration_ms / (1000 * 60 * 60), 1),
     }
 
 
+def _agg_popularity(merged: pd.DataFrame) -> Dict[str, any]:
+    return {"avg_popularity": round(merged["popularity"].mean(), 1)}
+
+
+def _agg_top_artists(merged: pd.DataFrame) -> Dict[str, any]:
+    # Top artists (by track count)
+    return {"top_artists": merged["primary_artist"].value_counts().head(5).to_dict()}
+
+
+def _agg_year_range(merged: pd.DataFrame) -> Dict[str, any]:
+    years = merged["release_year"].dropna()
+    if years.empty:
+        return {}
+    return {"year_range": (int(years.min()), int(years.max()))}
+
+
+def _agg_genres(merged: pd.DataFrame) -> Dict[str, any]:
+    # Only list/ndarray cells hold genre lists (explode() would pass scalar strings
+    # through as one "genre"); explode() flattens them in C, empty lists become NaN
+    cells = merged["genres"].dropna()
+    cells = cells[cells.map(lambda g: isinstance(g, (list, np.ndarray)))]
+    all_genres = cells.explode().dropna()
+    return {"genres": all_genres.value_counts().head(10).to_dict()}
+
+
+@lru_cache(maxsize=None)
+def _stats_plan(schema: _TrackSchema) -> Tuple[Tuple[str, ...], Tuple[Callable, ...]]:
+    """
+    Specialize the statistics computation for a track schema.
+    
+    Returns the track columns to merge and the aggregators to run, with
+    absent-column branches resolved once per schema rather than per call.
+    """
+    steps = [
+        (schema.has_duration, "duration_ms", _agg_duration),
+        (schema.has_popularity, "popularity", _agg_popularity),
+        (schema.has_primary_artist, "primary_artist", _agg_top_artists),
+        (schema.has_release_year, "release_year", _agg_year_range),
+        (schema.has_genres, "genres", _agg_genres),
+    ]
+    columns = ("track_id",) + tuple(col for present, col, _ in steps if present)
+    aggregators = tuple(fn for present, _, fn in steps if present)
+    return columns, aggregators
+
+
 def format_rich_description(
     base_description: str,
     stats: Dict[str, any],
@@ -234,7 +333,11 @@ def get_playlist_cover_image_url(
             selected = merged.head(1)
     elif strategy == "most_recent":
         if "added_at" in merged.columns:
-            selected = merged.nlargest(1, "added_at")
+            # Compare as int64 nanoseconds rather than ISO strings; NaT maps to
+            # the int64 minimum so argmax naturally skips missing timestamps
+            added_at = pd.to_datetime(merged["added_at"], errors="coerce", utc=True)
+            added_ns = added_at.dt.tz_localize(None).to_numpy().view("i8")
+            selected = merged.iloc[[int(added_ns.argmax())]]
         else:
             selected = merged.head(1)
     elif strategy == "random":
@@ -384,10 +487,9 @@ def check_playlist_health(
     
     # Check for duplicates
     if not playlist_tracks.empty:
-        track_counts = playlist_tracks["track_id"].value_counts()
-        duplicates = track_counts[track_counts > 1]
-        if len(duplicates) > 0:
-            warnings.append(f"{len(duplicates)} duplicate track(s)")
+        num_duplicates = _count_duplicated_tracks(playlist_tracks["track_id"])
+        if num_duplicates > 0:
+            warnings.append(f"{num_duplicates} duplicate track(s)")
     
     # Check metadata completeness
     if not playlist_tracks.empty:
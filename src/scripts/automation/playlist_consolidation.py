@@ -8,14 +8,24 @@ This module is extracted from sync.py and uses late imports to access
 utilities from sync.py to avoid circular dependencies.
 """
 
+import hashlib
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import spotipy
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
 from .formatting import format_playlist_name, format_yearly_playlist_name, format_playlist_description
 from .error_handling import handle_errors
+from .config import PARALLEL_MAX_WORKERS
+
+# Concurrent playlist deletions (each is a backup fetch plus an unfollow); kept
+# small so bulk cleanups stay well inside Spotify's rate limits
+_DELETE_MAX_WORKERS = 4
 
 @handle_errors(reraise=False, default_return=None, log_error=True)
 def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -> None:
@@ -49,20 +59,29 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
         log, verbose_log, DATA_DIR, OWNER_NAME, MONTH_NAMES,
         PREFIX_MONTHLY, PREFIX_MOST_PLAYED, PREFIX_DISCOVERY,
         ENABLE_MONTHLY, ENABLE_MOST_PLAYED, ENABLE_DISCOVERY,
-        LIKED_SONGS_PLAYLIST_ID, YEARLY_NAME_TEMPLATE,
-        get_existing_playlists, get_user_info, get_playlist_tracks,
+        YEARLY_NAME_TEMPLATE, SPOTIFY_API_MAX_TRACKS_PER_REQUEST,
+        get_existing_playlists, get_user_info, get_playlist_tracks, get_playlists_tracks,
         get_most_played_tracks, get_discovery_tracks,
         api_call,
         _chunked, _to_uri, _update_playlist_description_with_genres, _invalidate_playlist_cache,
+        _load_liked_songs,
     )
+    from .data_protection import safe_delete_playlist
     log("\n--- Ensure yearly archive playlists ---")
     
+    # Names are formatted for the same (year, type) pairs in detection and consolidation.
+    # Memoized per run only: formatting reads config at call time (reload_from_env).
+    _fpl = lru_cache(maxsize=None)(format_playlist_name)
+    _fypl = lru_cache(maxsize=None)(format_yearly_playlist_name)
+    
     # Calculate cutoff date (keep last N months)
     # We want to keep the last N months, so anything at or before (current - N months) should be consolidated
     # Example: If current is Jan 2026 and N=3, keep Nov 2025, Dec 2025, Jan 2026
     # So cutoff should be Oct 2025 (last month to consolidate)
     cutoff_date = datetime.now() - relativedelta(months=keep_last_n_months)
     cutoff_year_month = cutoff_date.strftime("%Y-%m")
+    # Months packed as year * 12 + month so cutoff checks are integer compares
+    cutoff_ym = cutoff_date.year * 12 + cutoff_date.month
     
     # Get all existing playlists (cached)
     existing = get_existing_playlists(sp)
@@ -87,54 +106,46 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
     
     monthly_playlists = {}  # {year: {type: [(name, id), ...]}}
     
+    # One precompiled pattern replaces the nested type × month prefix scans.
+    # setdefault keeps the first type for a shared prefix, as the old loop did.
+    prefix_to_type = {}
+    for playlist_type, prefix in playlist_types.items():
+        prefix_to_type.setdefault(prefix, playlist_type)
+    abbr_to_num = {}
+    for num, abbr in MONTH_NAMES.items():
+        abbr_to_num.setdefault(abbr, int(num))
+    monthly_name_re = re.compile(
+        rf"^{re.escape(OWNER_NAME)}"
+        rf"(?P<prefix>{'|'.join(map(re.escape, prefix_to_type))})"
+        rf"(?P<mon>{'|'.join(map(re.escape, abbr_to_num))})"
+        r"(?P<year>\d+)$"
+    )
+    
     for playlist_name, playlist_id in existing.items():
-        # Check each playlist type
-        for playlist_type, prefix in playlist_types.items():
-            monthly_pattern = f"{OWNER_NAME}{prefix}"
-            if playlist_name.startswith(monthly_pattern):
-                # Check if it matches monthly format (has a month name)
-                for mon_abbr in MONTH_NAMES.values():
-                    if playlist_name.startswith(f"{monthly_pattern}{mon_abbr}"):
-                        # Extract year (2 or 4 digits at the end)
-                        remaining = playlist_name[len(f"{monthly_pattern}{mon_abbr}"):]
-                        if remaining.isdigit():
-                            year_str = remaining
-                            # Convert 2-digit year to 4-digit (assume 2000s)
-                            if len(year_str) == 2:
-                                year = 2000 + int(year_str)
-                            else:
-                                year = int(year_str)
-                            
-                            # Find the month number from abbreviation
-                            month_num = None
-                            for num, abbr in MONTH_NAMES.items():
-                                if abbr == mon_abbr:
-                                    month_num = num
-                                    break
-                            
-                            if month_num:
-                                # Create YYYY-MM format string
-                                month_str = f"{year}-{month_num}"
-                                
-                                # Check if this month is at or before cutoff (should be consolidated)
-                                # Use <= to include the cutoff month itself
-                                if month_str <= cutoff_year_month:
-                                    if year not in monthly_playlists:
-                                        monthly_playlists[year] = {}
-                                    if playlist_type not in monthly_playlists[year]:
-                                        monthly_playlists[year][playlist_type] = []
-                                    monthly_playlists[year][playlist_type].append((playlist_name, playlist_id))
-                        break
-                break  # Found matching type, no need to check others
+        match = monthly_name_re.match(playlist_name) if prefix_to_type else None
+        if not match:
+            continue
+        playlist_type = prefix_to_type[match["prefix"]]
+        month_num = abbr_to_num[match["mon"]]
+        # Convert 2-digit year to 4-digit (assume 2000s)
+        year_str = match["year"]
+        year = 2000 + int(year_str) if len(year_str) == 2 else int(year_str)
+        
+        # Check if this month is at or before cutoff (should be consolidated)
+        # Use <= to include the cutoff month itself
+        if year * 12 + month_num <= cutoff_ym:
+            monthly_playlists.setdefault(year, {}).setdefault(playlist_type, []).append(
+                (playlist_name, playlist_id)
+            )
     
     # Load liked songs data to get tracks by year (for "Finds" playlists)
     year_to_tracks = {}
     try:
-        playlist_tracks_path = DATA_DIR / "playlist_tracks.parquet"
-        if playlist_tracks_path.exists():
-            library = pd.read_parquet(playlist_tracks_path)
-            liked = library[library["playlist_id"].astype(str) == LIKED_SONGS_PLAYLIST_ID].copy()
-            
+        # Only the liked rows and the columns used below are read from disk
+        liked = _load_liked_songs(
+            columns=["added_at", "playlist_added_at", "track_added_at", "track_uri", "track_id"]
+        )
+        if liked is not None:
             if not liked.empty:
                 # Parse timestamps
                 added_col = None
@@ -154,22 +165,21 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
                         liked["_uri"] = liked["track_id"].map(_to_uri)
                     
                     # Build year -> tracks mapping (only for months at or before cutoff)
-                    liked["year_month"] = liked[added_col].dt.to_period("M").astype(str)
-                    for year_month, group in liked.groupby("year_month"):
-                        if year_month <= cutoff_year_month:
-                            year = int(year_month.split("-")[0])
-                            uris = group["_uri"].dropna().tolist()
-                            # Deduplicate while preserving order
-                            seen = set()
-                            unique = [u for u in uris if not (u in seen or seen.add(u))]
-                            if year not in year_to_tracks:
-                                year_to_tracks[year] = []
-                            year_to_tracks[year].extend(unique)
-                    
-                    # Deduplicate tracks per year
-                    for year in year_to_tracks:
-                        seen = set()
-                        year_to_tracks[year] = [u for u in year_to_tracks[year] if not (u in seen or seen.add(u))]
+                    # Keep months as Periods (int64 ordinals) and compare to a Period cutoff
+                    liked["year_month"] = liked[added_col].dt.tz_localize(None).dt.to_period("M")
+                    cutoff_period = pd.Period(cutoff_year_month, freq="M")
+                    # Month order, then first occurrence per (year, uri), then one list per year
+                    old_liked = (
+                        liked.loc[liked["year_month"] <= cutoff_period, ["year_month", "year", "_uri"]]
+                        .dropna(subset=["_uri"])
+                        .sort_values("year_month", kind="stable")
+                        .drop_duplicates(subset=["year", "_uri"])
+                    )
+                    year_to_tracks = (
+                        old_liked.groupby(old_liked["year"].astype(int), sort=False)["_uri"]
+                        .agg(list)
+                        .to_dict()
+                    )
     except Exception as e:
         log(f"  ⚠️  Could not load liked songs data: {e}")
     
@@ -180,25 +190,32 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
     from src.analysis.streaming_history import load_streaming_history
     history_df = load_streaming_history(DATA_DIR)
     year_to_tracks_history = {}  # {year: {type: [uris]}}
+    history_groups = {}  # {year: history rows for that year}, split once
+    has_history = history_df is not None and not history_df.empty
+    # Track URI column, detected once and reused by the re-sort below
+    history_track_col = None
+    if has_history:
+        if 'track_uri' in history_df.columns:
+            history_track_col = 'track_uri'
+        elif 'spotify_track_uri' in history_df.columns:
+            history_track_col = 'spotify_track_uri'
     
-    if history_df is not None and not history_df.empty:
+    if has_history:
         try:
             history_df['timestamp'] = pd.to_datetime(history_df['timestamp'], errors='coerce', utc=True)
             history_df['year'] = history_df['timestamp'].dt.year
-            history_df['year_month'] = history_df['timestamp'].dt.to_period('M').astype(str)
+            history_df['year_month'] = history_df['timestamp'].dt.to_period('M')
             
-            # Get track URI column
-            track_col = None
-            if 'track_uri' in history_df.columns:
-                track_col = 'track_uri'
-            elif 'spotify_track_uri' in history_df.columns:
-                track_col = 'spotify_track_uri'
+            track_col = history_track_col
+            if track_col:
+                # Categorical keys: per-year groupbys hash integer codes, not URI strings
+                history_df[track_col] = history_df[track_col].astype('category')
+            history_groups = {int(year): group for year, group in history_df.groupby('year', sort=False)}
             
             if track_col:
                 # Get ALL years from streaming history (not just old months)
                 # Top/Dscvr are created as yearly playlists only (no monthly). Vbz/Rpt removed.
-                for year in history_df['year'].unique():
-                    year_data = history_df[history_df['year'] == year].copy()
+                for year, year_data in history_groups.items():
                     if year not in year_to_tracks_history:
                         year_to_tracks_history[year] = {}
                     
@@ -232,7 +249,8 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
     years_to_consolidate = set()
     
     # Get all years from all data sources
-    all_years = set(monthly_playlists.keys()) | set(year_to_tracks.keys()) | set(year_to_tracks_history.keys())
+    # dict keys-views support set algebra directly: one result set, no per-source copies
+    all_years = monthly_playlists.keys() | year_to_tracks.keys() | year_to_tracks_history.keys()
     
     # Check which years need consolidation (for all playlist types)
     for year in sorted(all_years):
@@ -252,14 +270,14 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
                     if (playlist_type == "most_played" and ENABLE_MOST_PLAYED) or \
                        (playlist_type == "discovery" and ENABLE_DISCOVERY):
                         # Check if yearly playlist exists
-                        yearly_name = format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type=playlist_type)
+                        yearly_name = _fpl(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type=playlist_type)
                         if yearly_name not in existing:
                             needs_consolidation = True
                             break
         
         # Check if "Finds" yearly playlist needs to be created (from liked songs data)
         if year in year_to_tracks and year_to_tracks[year]:
-            yearly_name = format_yearly_playlist_name(str(year))
+            yearly_name = _fypl(str(year))
             if yearly_name not in existing:
                 needs_consolidation = True
         
@@ -286,6 +304,17 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
         if sources:
             log(f"    {year}: {', '.join(sources)}")
     
+    # Fetch every monthly playlist to be merged up front, concurrently (network-bound)
+    monthly_track_cache = get_playlists_tracks(sp, [
+        monthly_id
+        for year in years_to_consolidate
+        for playlists in monthly_playlists.get(year, {}).values()
+        for _, monthly_id in playlists
+    ])
+    
+    # Playlists to fill per year: (type, name, pid, tracks to add, created, total tracks, tracks already in it)
+    year_jobs = {year: [] for year in years_to_consolidate}
+    
     # For each old year, consolidate into yearly playlists for each type
     for year in sorted(years_to_consolidate):
         year_short = str(year)[2:] if len(str(year)) == 4 else str(year)
@@ -293,77 +322,66 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
         # Process each playlist type
         for playlist_type, prefix in playlist_types.items():
             # Collect all tracks for this year and type
-            # Use list to preserve ordering for "Top" and other ordered playlists
-            all_tracks_list = []
-            all_tracks_set = set()  # For deduplication
+            # Insertion-ordered dict dedups while preserving ordering for "Top" and other ordered playlists
+            all_tracks = {}
             
             # First, try to get tracks from existing monthly playlists of this type
             if year in monthly_playlists and playlist_type in monthly_playlists[year]:
                 for monthly_name, monthly_id in monthly_playlists[year][playlist_type]:
-                    tracks = get_playlist_tracks(sp, monthly_id)
+                    tracks = monthly_track_cache[monthly_id]
                     # Preserve order from playlist (playlists are already ordered)
-                    for track in tracks:
-                        if track not in all_tracks_set:
-                            all_tracks_list.append(track)
-                            all_tracks_set.add(track)
+                    all_tracks.update(dict.fromkeys(tracks))
                     log(f"    - {monthly_name}: {len(tracks)} tracks")
             
             # If no tracks from playlists, use appropriate data source
-            if not all_tracks_list:
+            if not all_tracks:
                 if playlist_type == "monthly" and year in year_to_tracks:
                     # Use liked songs data for "Finds" playlists
-                    for track in year_to_tracks[year]:
-                        if track not in all_tracks_set:
-                            all_tracks_list.append(track)
-                            all_tracks_set.add(track)
+                    all_tracks.update(dict.fromkeys(year_to_tracks[year]))
                     log(f"    - Using liked songs data for {playlist_type}: {len(year_to_tracks[year])} tracks")
                 elif playlist_type in ["most_played", "discovery"]:  # Top and Discovery kept (time_based/repeat removed)
                     # Use streaming history data (already sorted)
                     if year in year_to_tracks_history and playlist_type in year_to_tracks_history[year]:
                         # These are already sorted by the get_*_tracks functions
-                        for track in year_to_tracks_history[year][playlist_type]:
-                            if track not in all_tracks_set:
-                                all_tracks_list.append(track)
-                                all_tracks_set.add(track)
+                        all_tracks.update(dict.fromkeys(year_to_tracks_history[year][playlist_type]))
                         log(f"    - Using streaming history for {playlist_type}: {len(year_to_tracks_history[year][playlist_type])} tracks")
+            all_tracks_list = list(all_tracks)
             
             # Re-sort tracks by play count if we got them from monthly playlists
             # Note: If tracks came from year_to_tracks_history, they're already sorted, so we skip re-sorting
             tracks_from_monthly = year in monthly_playlists and playlist_type in monthly_playlists.get(year, {})
             if all_tracks_list and playlist_type in ["most_played", "discovery"] and tracks_from_monthly:
                 # If we have streaming history for this year, re-sort by actual play counts
-                if history_df is not None and not history_df.empty:
+                if has_history and history_track_col:
                     try:
-                        # Filter to this year's data
-                        year_data = history_df[history_df['year'] == year].copy()
-                        if not year_data.empty:
-                            # Get track URI column
-                            track_col = None
-                            if 'track_uri' in year_data.columns:
-                                track_col = 'track_uri'
-                            elif 'spotify_track_uri' in year_data.columns:
-                                track_col = 'spotify_track_uri'
-                            
-                            if track_col:
-                                # Calculate play counts for all tracks
-                                track_stats = year_data.groupby(track_col).agg({
-                                    'ms_played': ['count', 'sum']
-                                }).reset_index()
-                                track_stats.columns = ['track_uri', 'play_count', 'total_ms']
-                                
-                                # Create a mapping of track URI to play count
-                                play_count_map = dict(zip(track_stats['track_uri'], track_stats['play_count']))
+                        # This year's data (read-only slice)
+                        year_data = history_groups.get(year)
+                        if year_data is not None and not year_data.empty:
+                            # Map track URI -> play count with numpy: bincount over the
+                            # categorical codes (-1 is missing), np.unique otherwise
+                            uris = year_data[history_track_col]
+                            if isinstance(uris.dtype, pd.CategoricalDtype):
+                                codes = uris.cat.codes.to_numpy()
+                                counts = np.bincount(codes[codes >= 0], minlength=len(uris.cat.categories))
+                                played = np.flatnonzero(counts)
+                                play_count_map = dict(zip(
+                                    uris.cat.categories.to_numpy()[played].tolist(),
+                                    counts[played].tolist(),
+                                ))
+                            else:
+                                unique_uris, counts = np.unique(uris.dropna().to_numpy(), return_counts=True)
+                                play_count_map = dict(zip(unique_uris.tolist(), counts.tolist()))
                                 
-                                # Sort tracks by play count (most played first)
-                                # Tracks not in history get play_count = 0
-                                if playlist_type == "most_played":
-                                    all_tracks_list.sort(
-                                        key=lambda uri: (play_count_map.get(uri, 0), 0),
-                                        reverse=True
-                                    )
-                                    log(f"    - Re-sorted {playlist_type} tracks by play count")
-                                # Discovery tracks are already sorted by first play time (most recent first)
-                                # from get_discovery_tracks, so we keep that order
+                            # Sort tracks by play count (most played first)
+                            # Tracks not in history get play_count = 0
+                            if playlist_type == "most_played":
+                                all_tracks_list.sort(
+                                    key=lambda uri: (play_count_map.get(uri, 0), 0),
+                                    reverse=True
+                                )
+                                log(f"    - Re-sorted {playlist_type} tracks by play count")
+                            # Discovery tracks are already sorted by first play time (most recent first)
+                            # from get_discovery_tracks, so we keep that order
                     except Exception as e:
                         log(f"    ⚠️  Could not re-sort tracks by play count: {e}")
                         # Continue with existing order if sorting fails
@@ -374,19 +392,19 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
             
             # Create yearly playlist for this type
             if playlist_type == "monthly":
-                main_playlist_name = format_yearly_playlist_name(str(year))
-                playlist_configs = [(main_playlist_name, "All tracks", None)]
+                main_playlist_name = _fypl(str(year))
+                playlist_configs = [(main_playlist_name, "All tracks")]
             else:
                 # For other types, create single yearly playlist
                 # Use yearly template format (no month) for yearly playlists
                 # The templates default to monthly format, so we use YEARLY_NAME_TEMPLATE as base
                 # but with the appropriate prefix for each type
-                yearly_name = format_playlist_name(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type=playlist_type)
+                yearly_name = _fpl(YEARLY_NAME_TEMPLATE, year=year_short, playlist_type=playlist_type)
                 playlist_configs = [
-                    (yearly_name, f"{playlist_type.replace('_', ' ').title()} tracks", None),
+                    (yearly_name, f"{playlist_type.replace('_', ' ').title()} tracks"),
                 ]
             
-            for playlist_name, description, genre_filter in playlist_configs:
+            for playlist_name, description in playlist_configs:
                 filtered_tracks = all_tracks_list
                 if not filtered_tracks:
                     log(f"    ⚠️  No tracks for {year}, skipping {playlist_name}")
@@ -400,17 +418,9 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
                         continue
                     pid = existing[playlist_name]
                     already = get_playlist_tracks(sp, pid)
+                    # Membership is O(1) (frozenset); keep filtered_tracks order for the additions
                     to_add = [u for u in filtered_tracks if u and isinstance(u, str) and u not in already]
-                    if to_add:
-                        for chunk in _chunked(to_add, 50):
-                            valid = [u for u in chunk if u and isinstance(u, str)]
-                            if valid:
-                                api_call(sp.playlist_add_items, pid, valid)
-                        log(f"  {playlist_name}: +{len(to_add)} tracks (total: {len(filtered_tracks)}; manually added tracks preserved)")
-                        _update_playlist_description_with_genres(sp, user_id, pid, None)
-                    else:
-                        log(f"  {playlist_name}: already up to date ({len(filtered_tracks)} tracks)")
-                        _update_playlist_description_with_genres(sp, user_id, pid, None)
+                    created = False
                 else:
                     pl = api_call(
                         sp.user_playlist_create,
@@ -420,36 +430,72 @@ def consolidate_old_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: i
                         description=format_playlist_description(description, period=str(year), playlist_type=playlist_type),
                     )
                     pid = pl["id"]
-                    valid_tracks = [u for u in filtered_tracks if u and isinstance(u, str)]
-                    for chunk in _chunked(valid_tracks, 50):
-                        if chunk:
-                            api_call(sp.playlist_add_items, pid, chunk)
-                    _update_playlist_description_with_genres(sp, user_id, pid, valid_tracks)
-                    log(f"  {playlist_name}: created with {len(valid_tracks)} tracks")
-                # Delete old monthly playlists if they existed (with verification)
-                if year in monthly_playlists and playlist_type in monthly_playlists[year]:
-                    final_yearly_tracks = get_playlist_tracks(sp, pid, force_refresh=True)
-                    for monthly_name, monthly_id in monthly_playlists[year][playlist_type]:
-                        try:
-                            monthly_tracks = get_playlist_tracks(sp, monthly_id, force_refresh=True)
-                            missing_tracks = monthly_tracks - final_yearly_tracks
-                            if missing_tracks:
-                                log(f"    ⚠️  WARNING: {len(missing_tracks)} tracks from '{monthly_name}' are NOT in yearly playlist!")
-                                continue
-                            from .data_protection import safe_delete_playlist
-                            success, backup_file = safe_delete_playlist(
-                                sp, monthly_id, monthly_name,
-                                create_backup=True,
-                                verify_tracks_preserved_in=pid
-                            )
-                            if success:
-                                _invalidate_playlist_cache()
-                                log(f"    ✓ Deleted {monthly_name} ({len(monthly_tracks)} tracks verified)")
-                            elif backup_file:
-                                log(f"    💾 Backup created: {backup_file.name}")
-                        except Exception as e:
-                            log(f"    ⚠️  Failed to delete {monthly_name}: {e}")
+                    to_add = [u for u in filtered_tracks if u and isinstance(u, str)]
+                    already = frozenset()
+                    created = True
+                year_jobs[year].append((playlist_type, playlist_name, pid, to_add, created, len(filtered_tracks), already))
+    
+    # Add tracks: chunks of one playlist stay sequential (order), playlists run concurrently
+    add_items = sp.playlist_add_items  # bound once, shared by every worker
+    
+    def _add_all_chunks(job):
+        _, _, pid, to_add, _, _, _ = job
+        for chunk in _chunked(to_add, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
+            api_call(add_items, pid, chunk)
+    
+    add_jobs = [job for jobs in year_jobs.values() for job in jobs if job[3]]
+    if add_jobs:
+        with ThreadPoolExecutor(max_workers=min(PARALLEL_MAX_WORKERS, len(add_jobs))) as executor:
+            list(executor.map(_add_all_chunks, add_jobs))
+    
+    # Re-fetch every yearly playlist whose monthlies will be deleted, concurrently, now that the adds are done
+    final_yearly_track_cache = get_playlists_tracks(sp, [
+        job[2]
+        for year in years_to_consolidate
+        for job in year_jobs[year]
+        if year in monthly_playlists and job[0] in monthly_playlists[year]
+    ], force_refresh=True)
+    
+    needs_invalidation = False
+    for year in sorted(years_to_consolidate):
+        for playlist_type, playlist_name, pid, to_add, created, total, already in year_jobs[year]:
+            if created:
+                _update_playlist_description_with_genres(sp, user_id, pid, to_add)
+                log(f"  {playlist_name}: created with {len(to_add)} tracks")
+            elif to_add:
+                log(f"  {playlist_name}: +{len(to_add)} tracks (total: {total}; manually added tracks preserved)")
+                # The playlist now holds exactly what was there plus what was added: no refetch needed
+                _update_playlist_description_with_genres(sp, user_id, pid, list(already.union(to_add)))
+            else:
+                log(f"  {playlist_name}: already up to date ({total} tracks)")
+                _update_playlist_description_with_genres(sp, user_id, pid, list(already))
+            # Delete old monthly playlists if they existed (with verification)
+            if year in monthly_playlists and playlist_type in monthly_playlists[year]:
+                final_yearly_tracks = final_yearly_track_cache[pid]
+                for monthly_name, monthly_id in monthly_playlists[year][playlist_type]:
+                    try:
+                        # One fresh read of the monthly playlist right before its delete;
+                        # safe_delete_playlist backs up exactly these tracks and refuses
+                        # unless they are all in the re-fetched yearly playlist
+                        monthly_tracks = get_playlist_tracks(sp, monthly_id, force_refresh=True)
+                        success, backup_file = safe_delete_playlist(
+                            sp, monthly_id, monthly_name,
+                            create_backup=True,
+                            verify_tracks_preserved_in=pid,
+                            preserved_tracks=final_yearly_tracks,
+                            tracks=monthly_tracks
+                        )
+                        if success:
+                            needs_invalidation = True
+                            log(f"    ✓ Deleted {monthly_name} ({len(monthly_tracks)} tracks verified)")
+                        elif backup_file:
+                            log(f"    💾 Backup created: {backup_file.name}")
+                    except Exception as e:
+                        log(f"    ⚠️  Failed to delete {monthly_name}: {e}")
         log(f"  ✅ Consolidated {year} into yearly playlists for all types")
+    # Deleted monthlies are only dropped from the playlist cache once, after the loop
+    if needs_invalidation:
+        _invalidate_playlist_cache()
 
 
 
@@ -460,28 +506,37 @@ def delete_old_monthly_playlists(sp: spotipy.Spotify) -> None:
     log("\n--- Deleting Old Monthly Playlists (no-op) ---")
 
 
-def _is_automated_monthly_playlist(name: str, owner: str, prefixes: list, month_abbrs: list) -> bool:
+@lru_cache(maxsize=None)
+def _monthly_playlist_pattern(owner: str, prefixes: tuple, month_abbrs: tuple) -> "re.Pattern":
+    """Compiled {owner}{prefix}{month}{year} pattern (one per owner/prefix/month set)."""
+    return re.compile(
+        rf"{re.escape(owner)}"
+        rf"(?:{'|'.join(map(re.escape, prefixes))})"
+        rf"(?:{'|'.join(map(re.escape, month_abbrs))})"
+        r"\d+"
+    )
+
+
+def _is_automated_monthly_playlist(name: str, owner: str, prefixes: tuple, month_abbrs: tuple) -> bool:
     """True if name matches {owner}{prefix}{month}{year} e.g. AJFindsJan26."""
-    if not name or not name.startswith(owner):
+    if not name or not name.startswith(owner) or not prefixes or not month_abbrs:
         return False
-    suffix = name[len(owner):]
-    for prefix in prefixes:
-        if suffix.startswith(prefix):
-            rest = suffix[len(prefix):]
-            for abbr in month_abbrs:
-                if rest.startswith(abbr) and len(rest) > len(abbr) and rest[len(abbr):].isdigit():
-                    return True
-    return False
+    if not isinstance(prefixes, tuple):
+        prefixes = tuple(prefixes)
+    if not isinstance(month_abbrs, tuple):
+        month_abbrs = tuple(month_abbrs)
+    return _monthly_playlist_pattern(owner, prefixes, month_abbrs).fullmatch(name) is not None
+
+
+# Old genre split: prefix + HipHop/Dance/Other + year, or master "Am" + genre
+_GENRE_SLUG_RE = re.compile("|".join(map(re.escape, ("HipHop", "Hip Hop", "Dance", "Other", "Am"))))
 
 
 def _is_automated_genre_playlist(name: str, owner: str) -> bool:
     """True if name looks like an automated genre playlist (HipHop, Dance, Other, or AJAm master)."""
     if not name or not name.startswith(owner):
         return False
-    rest = name[len(owner):]
-    # Old genre split: prefix + HipHop/Dance/Other + year, or master "Am" + genre
-    genre_slugs = ("HipHop", "Hip Hop", "Dance", "Other", "Am")
-    return any(s in rest for s in genre_slugs)
+    return _GENRE_SLUG_RE.search(name, len(owner)) is not None
 
 
 @handle_errors(reraise=False, default_return=None, log_error=True)
@@ -501,8 +556,9 @@ def delete_automated_monthly_and_genre_playlists(sp: spotipy.Spotify) -> None:
     log("\n--- Cleanup legacy automated playlists ---")
     existing = get_existing_playlists(sp, force_refresh=True)
     owner = OWNER_NAME
-    prefixes = [PREFIX_MONTHLY, PREFIX_MOST_PLAYED, PREFIX_DISCOVERY]
-    month_abbrs = list(MONTH_NAMES.values())
+    # Tuples built once per run: hashable keys for the cached name pattern
+    prefixes = (PREFIX_MONTHLY, PREFIX_MOST_PLAYED, PREFIX_DISCOVERY)
+    month_abbrs = tuple(MONTH_NAMES.values())
 
     to_delete = []
     yearly_names = set()
@@ -528,27 +584,50 @@ def delete_automated_monthly_and_genre_playlists(sp: spotipy.Spotify) -> None:
         return
 
     log(f"  Found {len(to_delete)} legacy playlist(s) to delete.")
-    deleted = 0
-    for playlist_name, playlist_id in to_delete:
+    
+    def _safe_del(item):
+        playlist_name, playlist_id = item
         try:
             success, backup_file = safe_delete_playlist(
                 sp, playlist_id, playlist_name,
                 create_backup=True,
                 verify_tracks_preserved_in=None,
             )
-            if success:
-                _invalidate_playlist_cache()
-                log(f"  Deleted: {playlist_name}")
-                deleted += 1
-            elif backup_file:
-                log(f"  Backup: {backup_file.name} (delete skipped or failed)")
+            return playlist_name, success, backup_file, None
         except Exception as e:
-            log(f"  Failed to delete {playlist_name}: {e}")
+            return playlist_name, False, None, e
+    
+    # Backup + delete per playlist is network-bound: fan out, then log in order
+    with ThreadPoolExecutor(max_workers=min(_DELETE_MAX_WORKERS, len(to_delete))) as executor:
+        results = list(executor.map(_safe_del, to_delete))
+    
+    deleted = 0
+    for playlist_name, success, backup_file, err in results:
+        if err is not None:
+            log(f"  Failed to delete {playlist_name}: {err}")
+        elif success:
+            log(f"  Deleted: {playlist_name}")
+            deleted += 1
+        elif backup_file:
+            log(f"  Backup: {backup_file.name} (delete skipped or failed)")
+    if deleted:
+        _invalidate_playlist_cache()
     log(f"  Done. Deleted {deleted} playlist(s).")
 
 
 
 
+def _track_set_digest(tracks) -> bytes:
+    """128-bit digest of a set of track URIs (order-independent; count is mixed in)."""
+    uris = sorted(tracks)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(len(uris)).encode())
+    for uri in uris:
+        h.update(b"\0")
+        h.update(uri.encode())
+    return h.digest()
+
+
 def delete_duplicate_playlists(sp: spotipy.Spotify) -> None:
     """Delete duplicate playlists based on track content (same tracks, different names).
     
@@ -557,9 +636,11 @@ def delete_duplicate_playlists(sp: spotipy.Spotify) -> None:
     """
     # Late imports from sync.py
     from .sync import (
-        log, get_existing_playlists, get_user_info, get_playlist_tracks,
-        api_call, _invalidate_playlist_cache
+        log, verbose_log, get_existing_playlists, get_user_info,
+        get_playlist_snapshot_id, get_playlist_track_total, iter_playlist_track_uris, api_call, _invalidate_playlist_cache,
+        _load_digest_cache, _save_digest_cache,
     )
+    from .data_protection import safe_delete_playlist
     log("\n--- Detecting and Deleting Duplicate Playlists ---")
     
     existing = get_existing_playlists(sp, force_refresh=True)
@@ -581,63 +662,127 @@ def delete_duplicate_playlists(sp: spotipy.Spotify) -> None:
         log(f"      Set MAX_PLAYLISTS_FOR_DUPLICATE_CHECK env var to override (current limit: {max_playlists})")
         return
     
-    # Build track set for each playlist
-    playlist_track_sets = {}
+    # Track count (and digest) per playlist, reused across runs while the playlist's
+    # snapshot_id is unchanged: {playlist_id: [snapshot_id, track_count, digest hex]}
+    digest_cache = _load_digest_cache()
+    
+    def _fingerprint(playlist_id):
+        """Return (snapshot_id, track_count, digest hex), or None if empty."""
+        # Empty playlists can never be duplicates: skip their page fetch and hashing
+        if get_playlist_track_total(sp, playlist_id) == 0:
+            return None
+        snapshot_id = get_playlist_snapshot_id(sp, playlist_id)
+        cached = digest_cache.get(playlist_id)
+        # Anything but a [snapshot_id, count, digest] entry with a digest (older cache
+        # formats, hand edits) is treated as a miss
+        if (
+            snapshot_id
+            and isinstance(cached, list)
+            and len(cached) == 3
+            and cached[0] == snapshot_id
+            and cached[2]
+        ):
+            return snapshot_id, cached[1], cached[2]
+        # The digest needs the whole deduplicated set, so one playlist's URIs are
+        # collected from the streamed pages; they are dropped (not cached) once hashed
+        uris = frozenset(iter_playlist_track_uris(sp, playlist_id))
+        return snapshot_id, len(uris), _track_set_digest(uris).hex()
+    
+    # Fingerprint each playlist (track count + digest of its track set)
+    # Track fetches are network-bound, so they run concurrently (bounded pool; api_call
+    # handles rate-limit retries).
+    size_buckets = {}  # {track count: [(name, id, digest), ...]}
+    new_digest_cache = {}
+    empty_playlists = []
     checked = 0
-    for name, playlist_id in existing.items():
-        try:
-            tracks = get_playlist_tracks(sp, playlist_id, force_refresh=False)  # Use cache if available
-            # Convert to frozenset for comparison (order doesn't matter)
-            track_set = frozenset(tracks)
-            if track_set in playlist_track_sets:
-                # Found a duplicate - add to the list
-                playlist_track_sets[track_set].append((name, playlist_id))
-            else:
-                playlist_track_sets[track_set] = [(name, playlist_id)]
-            checked += 1
-            if checked % 50 == 0:
-                log(f"  Progress: checked {checked}/{len(existing)} playlists...")
-        except Exception as e:
-            log(f"  ⚠️  Could not read tracks from '{name}': {e}")
+    with ThreadPoolExecutor(max_workers=min(PARALLEL_MAX_WORKERS, len(existing))) as executor:
+        futures = {
+            executor.submit(_fingerprint, playlist_id): (name, playlist_id)
+            for name, playlist_id in existing.items()
+        }
+        for future in as_completed(futures):
+            name, playlist_id = futures[future]
+            try:
+                fingerprint = future.result()
+                if fingerprint is None:
+                    empty_playlists.append(name)
+                else:
+                    snapshot_id, count, digest = fingerprint
+                    size_buckets.setdefault(count, []).append((name, playlist_id, digest))
+                    if snapshot_id:
+                        new_digest_cache[playlist_id] = [snapshot_id, count, digest]
+                checked += 1
+                if checked % 50 == 0:
+                    log(f"  Progress: checked {checked}/{len(existing)} playlists...")
+            except Exception as e:
+                log(f"  ⚠️  Could not read tracks from '{name}': {e}")
+                continue
+    
+    if empty_playlists:
+        verbose_log(f"  Skipped {len(empty_playlists)} empty playlist(s)")
+    
+    # Only playlists sharing a track count can be duplicates: group just those
+    # buckets by track-set digest (order doesn't matter)
+    playlist_track_sets = {}
+    for count, entries in size_buckets.items():
+        if len(entries) < 2:
             continue
+        for name, playlist_id, digest in entries:
+            entry = playlist_track_sets.setdefault(digest, {"count": count, "playlists": []})
+            entry["playlists"].append((name, playlist_id))
     
     # Find duplicates (playlists with same track set)
-    deleted_count = 0
-    for track_set, playlists in playlist_track_sets.items():
-        if len(playlists) > 1 and len(track_set) > 0:  # Only consider non-empty playlists
+    to_delete = []  # (duplicate name, duplicate id, kept playlist id)
+    for entry in playlist_track_sets.values():
+        playlists = entry["playlists"]
+        if len(playlists) > 1 and entry["count"] > 0:  # Only consider non-empty playlists
             # Sort by name to keep the first one (alphabetically)
             playlists_sorted = sorted(playlists, key=lambda x: x[0])
             keep_playlist = playlists_sorted[0]
             duplicates = playlists_sorted[1:]
             
-            log(f"  🔍 Found {len(playlists)} duplicate playlist(s) with {len(track_set)} tracks:")
+            log(f"  🔍 Found {len(playlists)} duplicate playlist(s) with {entry['count']} tracks:")
             log(f"     ✅ Keeping: '{keep_playlist[0]}'")
-            
-            for dup_name, dup_id in duplicates:
-                try:
-                    # Safe deletion with backup and verification
-                    from .data_protection import safe_delete_playlist
-                    # Verify tracks are preserved in the kept playlist
-                    success, backup_file = safe_delete_playlist(
-                        sp, dup_id, dup_name,
-                        create_backup=True,
-                        verify_tracks_preserved_in=keep_playlist[1]  # Verify in kept playlist
-                    )
-                    if success:
-                        log(f"     🗑️  Deleted: '{dup_name}'")
-                        deleted_count += 1
-                        # Remove from cache
-                        _invalidate_playlist_cache()
-                        if dup_name in existing:
-                            del existing[dup_name]
-                    else:
-                        log(f"     ⚠️  Skipped deletion of '{dup_name}' (safety check failed)")
-                        if backup_file:
-                            log(f"     💾 Backup created: {backup_file.name}")
-                except Exception as e:
-                    log(f"     ⚠️  Failed to delete '{dup_name}': {e}")
+            to_delete.extend((dup_name, dup_id, keep_playlist[1]) for dup_name, dup_id in duplicates)
+    
+    def _safe_del(item):
+        dup_name, dup_id, keep_id = item
+        try:
+            # Safe deletion with backup and verification
+            # Verify tracks are preserved in the kept playlist
+            success, backup_file = safe_delete_playlist(
+                sp, dup_id, dup_name,
+                create_backup=True,
+                verify_tracks_preserved_in=keep_id  # Verify in kept playlist
+            )
+            return dup_name, dup_id, success, backup_file, None
+        except Exception as e:
+            return dup_name, dup_id, False, None, e
+    
+    # Backup + verify + delete per playlist is network-bound: fan out, then log in order
+    results = []
+    if to_delete:
+        with ThreadPoolExecutor(max_workers=min(_DELETE_MAX_WORKERS, len(to_delete))) as executor:
+            results = list(executor.map(_safe_del, to_delete))
+    
+    deleted_count = 0
+    for dup_name, dup_id, success, backup_file, err in results:
+        if err is not None:
+            log(f"     ⚠️  Failed to delete '{dup_name}': {err}")
+        elif success:
+            log(f"     🗑️  Deleted: '{dup_name}'")
+            deleted_count += 1
+            new_digest_cache.pop(dup_id, None)
+        else:
+            log(f"     ⚠️  Skipped deletion of '{dup_name}' (safety check failed)")
+            if backup_file:
+                log(f"     💾 Backup created: {backup_file.name}")
+    
+    _save_digest_cache(new_digest_cache)
     
     if deleted_count > 0:
+        # Remove deleted playlists from the playlist cache once, after the loop
+        _invalidate_playlist_cache()
         log(f"  ✅ Deleted {deleted_count} duplicate playlist(s)")
     else:
         log("  ℹ️  No duplicate playlists found")
@@ -42,7 +42,7 @@ def create_or_update_playlist(
     # Late imports to avoid circular dependencies
     from .sync import (
         log, verbose_log, DATA_DIR, ENABLE_MONTHLY, ENABLE_MOST_PLAYED, ENABLE_DISCOVERY,
-        LIKED_SONGS_PLAYLIST_ID, get_playlist_tracks, api_call,
+        LIKED_SONGS_PLAYLIST_ID, SPOTIFY_API_MAX_TRACKS_PER_REQUEST, get_playlist_tracks, api_call,
         _chunked, _update_playlist_description_with_genres, _playlist_tracks_cache,
         _invalidate_playlist_cache
     )
@@ -52,15 +52,14 @@ def create_or_update_playlist(
         pid = existing_playlists[playlist_name]
         # Get existing tracks
         already = get_playlist_tracks(sp, pid)
-        # Only add tracks that aren't already present
-        to_add = [u for u in track_uris if u not in already]
+        # Only add tracks that aren't already present (each once, in track_uris order)
+        to_add = [u for u in dict.fromkeys(track_uris) if u not in already]
         
         if to_add:
-            for chunk in _chunked(to_add, 50):
+            for chunk in _chunked(to_add, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
                 api_call(sp.playlist_add_items, pid, chunk)
             # Invalidate cache
-            if pid in _playlist_tracks_cache:
-                del _playlist_tracks_cache[pid]
+            _playlist_tracks_cache.pop(pid, None)
             log(f"  {playlist_name}: +{len(to_add)} tracks (total: {len(track_uris)})")
             # Update description with genre tags
             _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
@@ -95,7 +94,7 @@ def create_or_update_playlist(
         pid = pl["id"]
         
         # Add tracks
-        for chunk in _chunked(track_uris, 50):
+        for chunk in _chunked(track_uris, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
             api_call(sp.playlist_add_items, pid, chunk)
         
         # Update description with genre tags
@@ -11,7 +11,7 @@ Creative enhancements for playlist management including:
 
 import spotipy
 import pandas as pd
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, FrozenSet, List, Tuple, Optional, Set
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
 import math
@@ -37,6 +37,17 @@ def calculate_playlist_similarity(
     return intersection / union if union > 0 else 0.0
 
 
+_NO_TRACKS: FrozenSet[str] = frozenset()
+
+
+def _playlist_track_sets(playlist_tracks_df: pd.DataFrame) -> Dict[str, FrozenSet[str]]:
+    """
+    Frozenset of track IDs per playlist_id, from one groupby over all playlist tracks.
+    Each set is shared read-only by every pairwise comparison it takes part in.
+    """
+    return playlist_tracks_df.groupby("playlist_id", sort=False)["track_id"].agg(frozenset).to_dict()
+
+
 def find_similar_playlists(
     playlists_df: pd.DataFrame,
     playlist_tracks_df: pd.DataFrame,
@@ -52,11 +63,12 @@ def find_similar_playlists(
         List of (playlist1_name, playlist2_name, similarity_score) tuples
     """
     # Build track sets for each playlist
+    track_sets = _playlist_track_sets(playlist_tracks_df)
     playlist_tracks = {}
-    for _, row in playlists_df.iterrows():
-        playlist_id = row["playlist_id"]
-        tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
-        playlist_tracks[playlist_id] = set(tracks["track_id"].unique())
+    names = {}
+    for playlist_id, name in zip(playlists_df["playlist_id"].to_numpy(), playlists_df["name"].to_numpy()):
+        playlist_tracks[playlist_id] = track_sets.get(playlist_id, _NO_TRACKS)
+        names.setdefault(playlist_id, name)
     
     # Calculate similarities
     similar = []
@@ -69,9 +81,7 @@ def find_similar_playlists(
                 playlist_tracks[pid2]
             )
             if similarity >= threshold:
-                name1 = playlists_df[playlists_df["playlist_id"] == pid1]["name"].iloc[0]
-                name2 = playlists_df[playlists_df["playlist_id"] == pid2]["name"].iloc[0]
-                similar.append((name1, name2, similarity))
+                similar.append((names[pid1], names[pid2], similarity))
     
     # Sort by similarity (highest first)
     similar.sort(key=lambda x: x[2], reverse=True)
@@ -158,20 +168,19 @@ def suggest_playlist_merge_candidates(
     
     # Get owned playlists only
     owned = (
-        playlists_df[playlists_df["is_owned"] == True].copy()
+        playlists_df.loc[playlists_df["is_owned"].to_numpy(dtype=bool, na_value=False)].copy()
         if "is_owned" in playlists_df.columns
         else playlists_df.copy()
     )
     
     # Build track sets
+    track_sets = _playlist_track_sets(playlist_tracks_df)
     playlist_tracks = {}
-    for _, row in owned.iterrows():
-        playlist_id = row["playlist_id"]
-        tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
-        track_set = set(tracks["track_id"].unique())
+    for playlist_id, name in zip(owned["playlist_id"].to_numpy(), owned["name"].to_numpy()):
+        track_set = track_sets.get(playlist_id, _NO_TRACKS)
         if len(track_set) >= size_threshold:
             playlist_tracks[playlist_id] = {
-                "name": row["name"],
+                "name": name,
                 "tracks": track_set,
                 "size": len(track_set)
             }
@@ -226,7 +235,7 @@ def generate_listening_insights_report(
     
     # Library statistics
     total_playlists = (
-        len(playlists_df[playlists_df["is_owned"] == True])
+        int(playlists_df["is_owned"].to_numpy(dtype=bool, na_value=False).sum())
         if "is_owned" in playlists_df.columns
         else len(playlists_df)
     )
@@ -242,19 +251,22 @@ def generate_listening_insights_report(
     
     # Genre distribution
     if "genres" in tracks_df.columns:
-        all_genres = []
-        for genres_list in tracks_df["genres"].dropna():
-            if isinstance(genres_list, list):
-                all_genres.extend(genres_list)
+        # One counting pass; the total for percentages comes from the same counts
+        genre_counts = Counter(
+            genre
+            for genres_list in tracks_df["genres"].dropna()
+            if isinstance(genres_list, list)
+            for genre in genres_list
+        )
+        total_genres = sum(genre_counts.values())
         
-        if all_genres:
-            genre_counts = Counter(all_genres)
+        if total_genres:
             top_genres = genre_counts.most_common(10)
             
             report_lines.append("🎸 TOP GENRES")
             report_lines.append("-" * 70)
             for genre, count in top_genres:
-                percentage = (count / len(all_genres)) * 100
+                percentage = (count / total_genres) * 100
                 bar_length = int(percentage / 2)  # Scale to 50 chars max
                 bar = "█" * bar_length
                 report_lines.append(f"   {genre:20s} {bar} {count:4d} ({percentage:5.1f}%)")
@@ -356,12 +368,12 @@ def calculate_playlist_health_score(
     # Genre diversity (bonus)
     merged = tracks.merge(tracks_df, on="track_id", how="left")
     if "genres" in merged.columns:
-        all_genres = []
-        for genres_list in merged["genres"].dropna():
-            if isinstance(genres_list, list):
-                all_genres.extend(genres_list)
-        
-        unique_genres = len(set(all_genres))
+        unique_genres = len({
+            genre
+            for genres_list in merged["genres"].dropna()
+            if isinstance(genres_list, list)
+            for genre in genres_list
+        })
         if unique_genres >= 5:
             score += min(unique_genres - 5, 10)
             factors["genre_diversity"] = unique_genres
@@ -8,7 +8,9 @@ Provides advanced playlist organization features including:
 - Playlist categorization
 """
 
+import re
 import spotipy
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
@@ -19,6 +21,24 @@ from .sync import DATA_DIR, api_call, log, verbose_log, get_existing_playlists,
 from .playlist_aesthetics import check_playlist_health, get_playlist_statistics
 
 
+# Name keywords per category, matched as substrings of the lowercased playlist name
+_CATEGORY_KEYWORDS = {
+    "automated_hint": ("finds", "top", "discovery", "dscvr", "fnds"),
+    "month": ("jan", "feb", "mar", "apr", "may", "jun",
+              "jul", "aug", "sep", "oct", "nov", "dec"),
+    "genre": ("hiphop", "dance", "r&b", "soul", "rock",
+              "pop", "jazz", "country", "electronic"),
+    "discovery": ("discovery", "new", "fresh", "latest"),
+    "favorites": ("liked", "favorite", "favourite", "best", "top"),
+}
+# One alternation per category: a single C-level scan instead of a Python loop per keyword
+_CATEGORY_PATTERNS = {
+    category: re.compile("|".join(map(re.escape, keywords)))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+_DIGIT_RE = re.compile(r"\d")
+
+
 def categorize_playlists(playlists_df: pd.DataFrame) -> Dict[str, List[str]]:
     """
     Categorize playlists into logical groups.
@@ -42,37 +62,36 @@ def categorize_playlists(playlists_df: pd.DataFrame) -> Dict[str, List[str]]:
         "genre": [],
         "time_based": []
     }
+    if playlists_df.empty:
+        return categories
+    
+    if "name" in playlists_df.columns:
+        names = playlists_df["name"].fillna("").astype(str).str.lower()
+    else:
+        names = pd.Series("", index=playlists_df.index)
+    matches = {
+        category: names.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+        for category, pattern in _CATEGORY_PATTERNS.items()
+    }
+    has_digit = names.str.contains(_DIGIT_RE, regex=True).to_numpy(dtype=bool)
     
-    for _, playlist in playlists_df.iterrows():
-        name = playlist.get("name", "").lower()
-        playlist_id = playlist["playlist_id"]
-        
-        # Check for automated playlists (monthly, yearly patterns)
-        if any(keyword in name for keyword in ["finds", "top", "discovery", "dscvr", "fnds"]):
-            if any(month in name for month in ["jan", "feb", "mar", "apr", "may", "jun", 
-                                               "jul", "aug", "sep", "oct", "nov", "dec"]):
-                categories["automated"].append(playlist_id)
-            elif any(char.isdigit() for char in name):  # Yearly playlists
-                categories["automated"].append(playlist_id)
-            else:
-                categories["time_based"].append(playlist_id)
-        
-        # Genre playlists
-        elif any(keyword in name for keyword in ["hiphop", "dance", "r&b", "soul", "rock", 
-                                                 "pop", "jazz", "country", "electronic"]):
-            categories["genre"].append(playlist_id)
-        
-        # Discovery playlists
-        elif any(keyword in name for keyword in ["discovery", "new", "fresh", "latest"]):
-            categories["discovery"].append(playlist_id)
-        
-        # Favorites
-        elif any(keyword in name for keyword in ["liked", "favorite", "favourite", "best", "top"]):
-            categories["favorites"].append(playlist_id)
-        
-        # Manual (everything else)
-        else:
-            categories["manual"].append(playlist_id)
+    # First matching rule wins, in the same order as the original per-row checks:
+    # automated hints (monthly/yearly names, else time-based), genre, discovery, favorites
+    hint = matches["automated_hint"]
+    category = np.select(
+        [
+            hint & (matches["month"] | has_digit),
+            hint,
+            matches["genre"],
+            matches["discovery"],
+            matches["favorites"],
+        ],
+        ["automated", "time_based", "genre", "discovery", "favorites"],
+        default="manual",
+    )
+    
+    for name, ids in playlists_df["playlist_id"].groupby(category, sort=False):
+        categories[name] = ids.tolist()
     
     return categories
 
@@ -93,53 +112,96 @@ def find_duplicate_tracks_in_playlist(
     return duplicates
 
 
+def _playlist_names(playlists_df: pd.DataFrame) -> pd.Series:
+    """Playlist names aligned with playlists_df ("Unknown" if there is no name column)."""
+    if "name" in playlists_df.columns:
+        return playlists_df["name"]
+    return pd.Series("Unknown", index=playlists_df.index)
+
+
+def _playlist_track_counts(playlist_tracks_df: pd.DataFrame) -> pd.Series:
+    """Number of track rows per playlist_id (one groupby over all playlist tracks)."""
+    return playlist_tracks_df.groupby("playlist_id", sort=False).size()
+
+
+def _playlist_latest_added(playlist_tracks_df: pd.DataFrame) -> pd.Series:
+    """
+    Most recent added_at (UTC) per playlist_id; empty if there is no added_at column.
+    The column is parsed once for all playlists (unparseable values become NaT).
+    """
+    if "added_at" not in playlist_tracks_df.columns:
+        return pd.Series(dtype="datetime64[ns, UTC]")
+    added_at = playlist_tracks_df["added_at"]
+    if not isinstance(added_at.dtype, pd.DatetimeTZDtype):
+        added_at = pd.to_datetime(added_at, errors="coerce", utc=True)
+    elif str(added_at.dt.tz) != "UTC":
+        added_at = added_at.dt.tz_convert("UTC")
+    return added_at.groupby(playlist_tracks_df["playlist_id"], sort=False).max()
+
+
+def count_duplicate_tracks_by_playlist(playlist_tracks_df: pd.DataFrame) -> pd.Series:
+    """
+    Count duplicated tracks in every playlist at once.
+    
+    Returns:
+        Series mapping playlist_id to the number of track IDs that appear more
+        than once in it (only playlists with duplicates are present)
+    """
+    pair_counts = playlist_tracks_df.groupby(["playlist_id", "track_id"], sort=False).size()
+    duplicated = pair_counts[pair_counts > 1]
+    return duplicated.groupby(level="playlist_id", sort=False).size()
+
+
 def find_empty_playlists(
     playlists_df: pd.DataFrame,
-    playlist_tracks_df: pd.DataFrame
+    playlist_tracks_df: pd.DataFrame,
+    track_counts: Optional[pd.Series] = None
 ) -> List[Tuple[str, str]]:
     """
     Find playlists with no tracks.
     
+    Args:
+        track_counts: Optional precomputed track count per playlist_id
+    
     Returns:
         List of (playlist_id, playlist_name) tuples
     """
-    empty = []
-    for _, playlist in playlists_df.iterrows():
-        playlist_id = playlist["playlist_id"]
-        tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
-        if tracks.empty:
-            empty.append((playlist_id, playlist.get("name", "Unknown")))
-    return empty
+    if track_counts is None:
+        track_counts = _playlist_track_counts(playlist_tracks_df)
+    is_empty = ~playlists_df["playlist_id"].isin(track_counts.index)
+    names = _playlist_names(playlists_df)
+    return list(zip(playlists_df["playlist_id"][is_empty], names[is_empty]))
 
 
 def find_stale_playlists(
     playlists_df: pd.DataFrame,
     playlist_tracks_df: pd.DataFrame,
-    days_threshold: int = 365
+    days_threshold: int = 365,
+    latest_added: Optional[pd.Series] = None
 ) -> List[Tuple[str, str, int]]:
     """
     Find playlists that haven't been updated in a while.
     
     Args:
         days_threshold: Number of days to consider a playlist stale
+        latest_added: Optional precomputed latest added_at per playlist_id
     
     Returns:
         List of (playlist_id, playlist_name, days_since_update) tuples
     """
-    stale = []
-    cutoff_date = pd.Timestamp.now("UTC") - timedelta(days=days_threshold)
+    if latest_added is None:
+        latest_added = _playlist_latest_added(playlist_tracks_df)
+    now = pd.Timestamp.now("UTC")
+    cutoff_date = now - timedelta(days=days_threshold)
 
-    for _, playlist in playlists_df.iterrows():
-        playlist_id = playlist["playlist_id"]
-        tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
-
-        if not tracks.empty and "added_at" in tracks.columns:
-            latest = pd.to_datetime(tracks["added_at"], utc=True).max()
-            if latest < cutoff_date:
-                days_ago = (pd.Timestamp.now("UTC") - latest).days
-                stale.append((playlist_id, playlist.get("name", "Unknown"), days_ago))
-    
-    return stale
+    if latest_added.empty:
+        return []
+    # Positional lookup per playlist row (NaT for playlists without tracks)
+    latest = latest_added.reindex(playlists_df["playlist_id"].to_numpy())
+    is_stale = (latest < cutoff_date).to_numpy(dtype=bool)
+    days_ago = (now - latest[is_stale]).dt.days
+    names = _playlist_names(playlists_df)
+    return list(zip(playlists_df["playlist_id"][is_stale], names[is_stale], days_ago.tolist()))
 
 
 def get_playlist_organization_report(
@@ -153,20 +215,20 @@ def get_playlist_organization_report(
     Returns:
         Dictionary with organization metrics and recommendations
     """
+    # Per-playlist aggregates computed once and shared by the checks below
+    track_counts = _playlist_track_counts(playlist_tracks_df)
+    latest_added = _playlist_latest_added(playlist_tracks_df)
+    duplicate_counts = count_duplicate_tracks_by_playlist(playlist_tracks_df)
+    
     categories = categorize_playlists(playlists_df)
-    empty_playlists = find_empty_playlists(playlists_df, playlist_tracks_df)
-    stale_playlists = find_stale_playlists(playlists_df, playlist_tracks_df)
+    empty_playlists = find_empty_playlists(playlists_df, playlist_tracks_df, track_counts=track_counts)
+    stale_playlists = find_stale_playlists(playlists_df, playlist_tracks_df, latest_added=latest_added)
     
     # Count duplicates across all playlists
-    total_duplicates = 0
-    playlists_with_duplicates = []
-    for _, playlist in playlists_df.iterrows():
-        duplicates = find_duplicate_tracks_in_playlist(
-            playlist_tracks_df, playlist["playlist_id"]
-        )
-        if duplicates:
-            total_duplicates += len(duplicates)
-            playlists_with_duplicates.append(playlist["name"])
+    playlist_duplicates = duplicate_counts.reindex(playlists_df["playlist_id"].to_numpy(), fill_value=0)
+    has_duplicates = (playlist_duplicates > 0).to_numpy()
+    total_duplicates = int(playlist_duplicates.sum())
+    playlists_with_duplicates = playlists_df["name"][has_duplicates].tolist()
     
     # Calculate statistics
     total_playlists = len(playlists_df)
@@ -248,12 +310,16 @@ def remove_duplicate_tracks_from_playlist(
     playlist_tracks = playlist_tracks_df[playlist_tracks_df["playlist_id"] == playlist_id]
     to_remove = []
     
-    for track_id in duplicates:
-        # Get all occurrences of this track
-        occurrences = playlist_tracks[playlist_tracks["track_id"] == track_id]
-        # Keep first, remove rest
-        if "position" in occurrences.columns:
-            positions = sorted(occurrences["position"].tolist())
+    if "position" in playlist_tracks.columns:
+        # Index positions by track once instead of scanning the playlist per duplicate
+        positions_by_track = {}
+        for track_id, position in zip(
+            playlist_tracks["track_id"].to_numpy(), playlist_tracks["position"].to_numpy()
+        ):
+            positions_by_track.setdefault(track_id, []).append(position)
+        for track_id in duplicates:
+            # Keep first, remove rest
+            positions = sorted(positions_by_track[track_id])
             to_remove.extend(positions[1:])  # Remove all but first
     
     if not dry_run and to_remove:
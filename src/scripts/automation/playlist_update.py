@@ -7,14 +7,50 @@ This module is extracted from sync.py and uses late imports to access
 utilities from sync.py to avoid circular dependencies.
 """
 
+import hashlib
 import spotipy
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
+from src.scripts.common.sidecar import sidecar_path, read_sidecar, write_sidecar
+
+from .config import PARALLEL_MAX_WORKERS
 from .formatting import format_playlist_name, format_playlist_description
 from .error_handling import handle_errors
 
+def _track_list_signature(track_uris: list) -> str:
+    """128-bit order-independent signature of a playlist's track URIs."""
+    return hashlib.blake2b(",".join(sorted(track_uris)).encode(), digest_size=16).hexdigest()
+
+
+def _load_verified_snapshots() -> dict:
+    """{playlist_id: [snapshot_id, track list signature]} for monthly playlists found complete."""
+    from .sync import DATA_DIR
+    return read_sidecar(sidecar_path(DATA_DIR, "monthly_verified"))
+
+
+def _save_verified_snapshots(verified: dict) -> None:
+    from .sync import DATA_DIR, verbose_log
+    try:
+        write_sidecar(sidecar_path(DATA_DIR, "monthly_verified"), verified)
+    except OSError as e:
+        verbose_log(f"  Could not save verified playlist snapshots: {e}")
+
+
+def _month_strings(timestamps: pd.Series) -> pd.Series:
+    """Format UTC timestamps as YYYY-MM month keys (missing stays missing).
+    Uses Arrow's strftime kernel when available instead of building a Period column."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return timestamps.dt.strftime("%Y-%m")
+    months = pc.strftime(pa.Array.from_pandas(timestamps), format="%Y-%m")
+    return pd.Series(months.to_pandas(), index=timestamps.index)
+
+
 @handle_errors(reraise=False, default_return={}, log_error=True)
 def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -> dict:
     """Update monthly playlists for the last N months by calendar (including current month).
@@ -40,8 +76,10 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
     # Late imports from sync.py
     from .sync import (
         log, verbose_log, DATA_DIR, ENABLE_MONTHLY, ENABLE_MOST_PLAYED, ENABLE_DISCOVERY,
-        LIKED_SONGS_PLAYLIST_ID, MONTHLY_NAME_TEMPLATE, get_existing_playlists, get_user_info, get_playlist_tracks, api_call,
-        _chunked, _update_playlist_description_with_genres, _playlist_tracks_cache, _invalidate_playlist_cache
+        MONTHLY_NAME_TEMPLATE, SPOTIFY_API_MAX_TRACKS_PER_REQUEST, get_existing_playlists, get_user_info, get_playlist_tracks,
+        get_playlist_snapshot_id, api_call,
+        _chunked, _to_uri, _update_playlist_description_with_genres, _playlist_tracks_cache, _invalidate_playlist_cache,
+        _load_liked_songs,
     )
     log(f"\n--- Monthly Playlists (Last {keep_last_n_months} Months Only) ---")
     
@@ -106,13 +144,13 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
         log("      Export streaming history data to enable these playlist types")
     
     # Load liked songs data for "Finds" playlists (API data only - never uses streaming history)
-    playlist_tracks_path = DATA_DIR / "playlist_tracks.parquet"
     all_month_to_tracks = {}
     
-    if playlist_tracks_path.exists():
-        library = pd.read_parquet(playlist_tracks_path)
-        liked = library[library["playlist_id"].astype(str) == LIKED_SONGS_PLAYLIST_ID].copy()
-        
+    # Only the liked rows and the columns used below are read from disk
+    liked = _load_liked_songs(
+        columns=["added_at", "playlist_added_at", "track_added_at", "track_uri", "track_id"]
+    )
+    if liked is not None:
         if not liked.empty:
             # Parse timestamps
             added_col = None
@@ -122,21 +160,22 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
                     break
             
             if added_col:
-                liked[added_col] = pd.to_datetime(liked[added_col], errors="coerce", utc=True)
-                liked["month"] = liked[added_col].dt.to_period("M").astype(str)
-                
-                # Handle both track_uri and track_id columns
-                if "track_uri" in liked.columns:
-                    liked["_uri"] = liked["track_uri"]
-                else:
-                    liked["_uri"] = liked["track_id"].map(_to_uri)
+                added_at = pd.to_datetime(liked[added_col], errors="coerce", utc=True)
+                liked = liked.assign(**{
+                    "month": _month_strings(added_at),
+                    # Handle both track_uri and track_id columns
+                    "_uri": liked["track_uri"] if "track_uri" in liked.columns else liked["track_id"].map(_to_uri),
+                })
                 
-                # Build month -> tracks mapping for "Finds" playlists (API data only)
-                for month, group in liked.groupby("month"):
-                    uris = group["_uri"].dropna().tolist()
-                    seen = set()
-                    unique = [u for u in uris if not (u in seen or seen.add(u))]
-                    all_month_to_tracks[month] = {"monthly": unique}
+                # Build month -> tracks mapping for "Finds" playlists (API data only);
+                # first occurrence of each URI within a month, in library order
+                month_uris = (
+                    liked.dropna(subset=["_uri"])
+                    .drop_duplicates(subset=["month", "_uri"], keep="first")
+                    .groupby("month", sort=True)["_uri"]
+                    .agg(list)
+                )
+                all_month_to_tracks = {month: {"monthly": uris} for month, uris in month_uris.items()}
                 
                 log(f"  Loaded liked songs (API data) for 'Finds' playlists: {len(all_month_to_tracks)} month(s)")
         else:
@@ -145,7 +184,7 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
         log("  ⚠️  Library data not found - 'Finds' playlists will be empty (run full sync first)")
     
     # Get months for "Finds" playlists (API data only - liked songs)
-    finds_months = set(all_month_to_tracks.keys())
+    finds_months = all_month_to_tracks.keys()
     
     # Get months for other playlist types (streaming history)
     history_months = set()
@@ -157,9 +196,10 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
     # Example: on 1 Feb 2026 with N=3 -> [2025-12, 2026-01, 2026-02]; create AJFndsFeb26, AJFndsJan26, AJFndsDec25
     now = datetime.now()
     calendar_last_n = [(now - relativedelta(months=i)).strftime("%Y-%m") for i in range(keep_last_n_months)]
-    recent_months = sorted(set(calendar_last_n))
+    recent_month_set = set(calendar_last_n)
+    recent_months = sorted(recent_month_set)
     all_months = finds_months | history_months
-    older_months = [m for m in sorted(all_months) if m not in recent_months] if all_months else []
+    older_months = sorted(all_months - recent_month_set)
     if older_months:
         log(f"📅 Keeping last {keep_last_n_months} months (by calendar) as monthly: {', '.join(recent_months)}")
         log(f"📦 Older months will be merged into yearly playlists then removed: {', '.join(older_months[:10])}{'…' if len(older_months) > 10 else ''}")
@@ -200,6 +240,11 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
         return {}
     
     month_to_tracks = {}
+    # (name, playlist_id, track_uris, to_add, created) per playlist; adds run after the scan
+    playlist_jobs = []
+    # {playlist_id: [snapshot_id, track list signature]} last seen with nothing to add
+    verified = _load_verified_snapshots()
+    verified_changed = False
     
     for month in sorted(recent_months):
         month_to_tracks[month] = {}
@@ -215,26 +260,21 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
             # Create or update even when empty so new month gets a playlist on rollover (e.g. AJFndsFeb26 on 1 Feb)
             if name in existing:
                 pid = existing[name]
+                # Same source tracks and an untouched playlist since it was last found
+                # complete: nothing can be missing, so skip fetching its tracks
+                tag_sig = _track_list_signature(track_uris)
+                snapshot_id = get_playlist_snapshot_id(sp, pid)
+                if snapshot_id and verified.get(pid) == [snapshot_id, tag_sig]:
+                    playlist_jobs.append((name, pid, track_uris, [], False))
+                    continue
                 already = get_playlist_tracks(sp, pid)
                 to_add = [u for u in track_uris if u not in already]
-                
-                if to_add:
-                    for chunk in _chunked(to_add, 50):
-                        api_call(sp.playlist_add_items, pid, chunk)
-                    if pid in _playlist_tracks_cache:
-                        del _playlist_tracks_cache[pid]
-                    log(f"  {name}: +{len(to_add)} tracks ({len(track_uris)} total)")
-                else:
-                    log(f"  {name}: up to date ({len(track_uris)} tracks)")
-                # Update description with genre tags (even if 0 tracks)
-                _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
+                if not to_add and snapshot_id:
+                    verified[pid] = [snapshot_id, tag_sig]
+                    verified_changed = True
+                playlist_jobs.append((name, pid, track_uris, to_add, False))
             else:
                 # Create playlist (may be empty for first day of new month)
-                from calendar import monthrange
-                year, month_num = map(int, month.split("-"))
-                last_day = monthrange(year, month_num)[1]
-                created_at = datetime(year, month_num, last_day, 23, 59, 59)
-                
                 verbose_log(f"Creating new playlist '{name}' for {month} (type={playlist_type})...")
                 pl = api_call(
                     sp.user_playlist_create,
@@ -245,21 +285,41 @@ def update_monthly_playlists(sp: spotipy.Spotify, keep_last_n_months: int = 3) -
                 )
                 pid = pl["id"]
                 verbose_log(f"  Created playlist '{name}' with id {pid}")
-                
-                # Add tracks
-                verbose_log(f"  Adding {len(track_uris)} tracks in chunks...")
-                chunk_count = 0
-                for chunk in _chunked(track_uris, 50):
-                    chunk_count += 1
-                    verbose_log(f"    Adding chunk {chunk_count} ({len(chunk)} tracks)...")
-                    api_call(sp.playlist_add_items, pid, chunk)
-                
-                # Update description with genre tags
-                _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
-                
-                _invalidate_playlist_cache()
-                verbose_log(f"  Invalidated playlist cache after creating new playlist")
-                log(f"  {name}: created with {len(track_uris)} tracks")
+                playlist_jobs.append((name, pid, track_uris, track_uris, True))
+    
+    if verified_changed:
+        _save_verified_snapshots(verified)
+    
+    # Add tracks: playlists in parallel (network-bound); chunks stay in order within a playlist
+    add_items = sp.playlist_add_items  # bound once, shared by every worker
+    
+    def _add_all_chunks(job):
+        name, pid, _, to_add, _ = job
+        verbose_log(f"  Adding {len(to_add)} tracks to '{name}' in chunks...")
+        for chunk in _chunked(to_add, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
+            api_call(add_items, pid, chunk)
+    
+    add_jobs = [job for job in playlist_jobs if job[3]]
+    if add_jobs:
+        with ThreadPoolExecutor(max_workers=min(PARALLEL_MAX_WORKERS, len(add_jobs))) as executor:
+            list(executor.map(_add_all_chunks, add_jobs))
+    
+    created_any = False
+    for name, pid, track_uris, to_add, created in playlist_jobs:
+        if created:
+            created_any = True
+            log(f"  {name}: created with {len(track_uris)} tracks")
+        elif to_add:
+            _playlist_tracks_cache.pop(pid, None)
+            log(f"  {name}: +{len(to_add)} tracks ({len(track_uris)} total)")
+        else:
+            log(f"  {name}: up to date ({len(track_uris)} tracks)")
+        # Update description with genre tags (even if 0 tracks)
+        _update_playlist_description_with_genres(sp, user_id, pid, track_uris)
+    
+    if created_any:
+        _invalidate_playlist_cache()
+        verbose_log(f"  Invalidated playlist cache after creating new playlist(s)")
     
     return month_to_tracks
 
@@ -271,6 +331,7 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
     """
     from .sync import (
         log, verbose_log, DATA_DIR, ENABLE_MONTHLY, ENABLE_MOST_PLAYED, ENABLE_DISCOVERY,
+        SPOTIFY_API_MAX_TRACKS_PER_REQUEST,
         get_existing_playlists, get_user_info, get_playlist_tracks, get_liked_song_uris, api_call,
         _chunked, _update_playlist_description_with_genres, _invalidate_playlist_cache, _to_uri,
     )
@@ -291,12 +352,11 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
             pid = existing[finds_name]
             liked_uris = get_liked_song_uris(sp)
             already = get_playlist_tracks(sp, pid)
-            to_add = [u for u in liked_uris if u and isinstance(u, str) and u not in already]
+            # get_liked_song_uris only returns non-empty URI strings
+            to_add = [u for u in liked_uris if u not in already]
             if to_add:
-                for chunk in _chunked(to_add, 50):
-                    valid = [u for u in chunk if u and isinstance(u, str)]
-                    if valid:
-                        api_call(sp.playlist_add_items, pid, valid)
+                for chunk in _chunked(to_add, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
+                    api_call(sp.playlist_add_items, pid, chunk)
                 _invalidate_playlist_cache()
                 log(f"  {finds_name}: +{len(to_add)} tracks (total liked: {len(liked_uris)})")
             else:
@@ -312,10 +372,8 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
                 description=format_playlist_description("Liked songs", period=str(current_year), playlist_type="monthly"),
             )
             pid = pl["id"]
-            valid_uris = [u for u in liked_uris if u and isinstance(u, str)]
-            for chunk in _chunked(valid_uris, 50):
-                if chunk:
-                    api_call(sp.playlist_add_items, pid, chunk)
+            for chunk in _chunked(liked_uris, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
+                api_call(sp.playlist_add_items, pid, chunk)
             _update_playlist_description_with_genres(sp, user_id, pid, liked_uris)
             _invalidate_playlist_cache()
             log(f"  {finds_name}: created with {len(liked_uris)} tracks")
@@ -344,10 +402,9 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
                     already = get_playlist_tracks(sp, pid)
                     to_add = [u for u in top_uris if u and isinstance(u, str) and u not in already]
                     if to_add:
-                        for chunk in _chunked(to_add, 50):
-                            valid = [u for u in chunk if u and isinstance(u, str)]
-                            if valid:
-                                api_call(sp.playlist_add_items, pid, valid)
+                        # to_add is already filtered to valid URIs: send its slices as-is
+                        for chunk in _chunked(to_add, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
+                            api_call(sp.playlist_add_items, pid, chunk)
                         _invalidate_playlist_cache()
                         log(f"  {top_name}: +{len(to_add)} tracks")
                     else:
@@ -356,9 +413,8 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
                     pl = api_call(sp.user_playlist_create, user_id, top_name, public=False,
                         description=format_playlist_description("Most played", period=str(current_year), playlist_type="most_played"))
                     valid_top = [u for u in top_uris if u and isinstance(u, str)]
-                    for chunk in _chunked(valid_top, 50):
-                        if chunk:
-                            api_call(sp.playlist_add_items, pl["id"], chunk)
+                    for chunk in _chunked(valid_top, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
+                        api_call(sp.playlist_add_items, pl["id"], chunk)
                     _update_playlist_description_with_genres(sp, user_id, pl["id"], top_uris)
                     _invalidate_playlist_cache()
                     log(f"  {top_name}: created with {len(top_uris)} tracks")
@@ -370,10 +426,9 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
                     already = get_playlist_tracks(sp, pid)
                     to_add = [u for u in disc_uris if u and isinstance(u, str) and u not in already]
                     if to_add:
-                        for chunk in _chunked(to_add, 50):
-                            valid = [u for u in chunk if u and isinstance(u, str)]
-                            if valid:
-                                api_call(sp.playlist_add_items, pid, valid)
+                        # to_add is already filtered to valid URIs: send its slices as-is
+                        for chunk in _chunked(to_add, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
+                            api_call(sp.playlist_add_items, pid, chunk)
                         _invalidate_playlist_cache()
                         log(f"  {disc_name}: +{len(to_add)} tracks")
                     else:
@@ -382,9 +437,8 @@ def update_current_year_playlists(sp: spotipy.Spotify) -> None:
                     pl = api_call(sp.user_playlist_create, user_id, disc_name, public=False,
                         description=format_playlist_description("Discovery", period=str(current_year), playlist_type="discovery"))
                     valid_disc = [u for u in disc_uris if u and isinstance(u, str)]
-                    for chunk in _chunked(valid_disc, 50):
-                        if chunk:
-                            api_call(sp.playlist_add_items, pl["id"], chunk)
+                    for chunk in _chunked(valid_disc, SPOTIFY_API_MAX_TRACKS_PER_REQUEST):
+                        api_call(sp.playlist_add_items, pl["id"], chunk)
                     _update_playlist_description_with_genres(sp, user_id, pl["id"], disc_uris)
                     _invalidate_playlist_cache()
                     log(f"  {disc_name}: created with {len(disc_uris)} tracks")
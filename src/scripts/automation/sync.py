@@ -28,6 +28,7 @@ import argparse
 import os
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 warnings.filterwarnings("ignore", message=".*urllib3.*OpenSSL.*", category=UserWarning)
@@ -91,7 +92,10 @@ from src.scripts.automation.playlist_consolidation import (
 )
 
 # Import standardized API wrapper
-from src.scripts.common.api_wrapper import api_call as standard_api_call, safe_api_call
+from src.scripts.common.api_wrapper import (
+    api_call as standard_api_call, safe_api_call, load_rate_state, save_rate_state,
+)
+from src.scripts.common.sidecar import sidecar_path
 
 # Import error handling decorators
 from src.scripts.automation.error_handling import handle_errors, retry_on_error, get_logger as get_error_logger
@@ -159,12 +163,20 @@ from src.scripts.automation._sync_impl import (
     _chunked,
     get_existing_playlists,
     get_playlist_tracks,
+    get_playlists_tracks,
+    get_playlist_snapshot_id,
+    get_playlist_track_total,
+    iter_playlist_track_uris,
     get_liked_song_uris,
     get_user_info,
     _invalidate_playlist_cache,
+    _load_liked_songs,
+    _load_digest_cache,
+    _save_digest_cache,
     _playlist_tracks_cache,
     _to_uri,
     _update_playlist_description_with_genres,
+    flush_description_snapshot_cache,
     sync_full_library,
     sync_export_data,
     rename_playlists_with_old_prefixes,
@@ -239,6 +251,10 @@ Examples:
     error = None
     summary = {}
     
+    # Start from the rate-limit backoff the previous run ended with
+    rate_state_path = sidecar_path(get_sync_data_dir(), "rate_limit")
+    load_rate_state(rate_state_path)
+    
     try:
         verbose_log("Initializing Spotify client...")
         sp = get_spotify_client()
@@ -253,6 +269,7 @@ Examples:
             import traceback
             verbose_log(f"Traceback:\n{traceback.format_exc()}")
         error = e
+        save_rate_state(rate_state_path)
         _send_email_notification(False, error=error)
         sys.exit(1)
     
@@ -280,6 +297,16 @@ Examples:
         verbose_log(f"Configuration: steps={steps_to_run!r}, skip_sync={args.skip_sync}, sync_only={args.sync_only}")
         verbose_log(f"Environment: OWNER_NAME={OWNER_NAME}, BASE_PREFIX={BASE_PREFIX}")
 
+        # Parquet exports shared by the post-sync steps: each file is read at most once per run
+        frames = {}
+
+        def _read_frame(name):
+            """Return a private copy of the export; steps may add columns or mutate it."""
+            if name not in frames:
+                import pandas as pd
+                frames[name] = pd.read_parquet(get_sync_data_dir() / f"{name}.parquet")
+            return frames[name].copy()
+
         for step_id in steps_to_run:
             log("")
             if step_id == "sync":
@@ -288,6 +315,7 @@ Examples:
                     sync_success = sync_full_library(force=args.force)
                     summary["sync_completed"] = "Yes" if sync_success else "No"
                     verbose_log(f"Sync completed: success={sync_success}")
+                    frames.clear()  # exports were rewritten
 
             elif step_id == "rename":
                 log(">>> STEP: RENAME PLAYLISTS <<<")
@@ -313,25 +341,31 @@ Examples:
                 log(">>> STEP: PLAYLIST DESCRIPTIONS <<<")
                 with timed_step("Update playlist descriptions"):
                     try:
-                        import pandas as _pd
                         sync_data_dir = get_sync_data_dir()
                         playlists_path = sync_data_dir / "playlists.parquet"
                         if not playlists_path.exists():
                             log(f"  playlists.parquet not found at {playlists_path}; skipping description updates")
                         else:
                             log(f"  Using playlists from {playlists_path}")
-                            playlists_df = _pd.read_parquet(playlists_path)
+                            playlists_df = _read_frame("playlists")
                             if "is_owned" not in playlists_df.columns:
                                 owned = playlists_df
                             else:
-                                owned = playlists_df[playlists_df["is_owned"] == True]
+                                owned = playlists_df.loc[playlists_df["is_owned"].to_numpy(dtype=bool, na_value=False)]
                             n_owned = len(owned)
                             log(f"  Updating descriptions for {n_owned} owned playlist(s)...")
-                            for idx, (_, row) in enumerate(owned.iterrows()):
-                                pid = row.get("playlist_id") or row.get("id")
-                                if pid:
-                                    verbose_log(f"  Description update {idx + 1}/{n_owned}: playlist_id={pid}")
-                                    _update_playlist_description_with_genres(sp, user["id"], pid, None)
+                            id_col = "playlist_id" if "playlist_id" in owned.columns else "id"
+                            pids = [pid for pid in owned[id_col].tolist() if pid] if id_col in owned.columns else []
+
+                            def _update_description(job):
+                                idx, pid = job
+                                verbose_log(f"  Description update {idx + 1}/{n_owned}: playlist_id={pid}")
+                                _update_playlist_description_with_genres(sp, user["id"], pid, None)
+
+                            # One metadata round-trip (or more) per playlist: run them concurrently
+                            if pids:
+                                with ThreadPoolExecutor(max_workers=min(PARALLEL_MAX_WORKERS, len(pids))) as executor:
+                                    list(executor.map(_update_description, enumerate(pids)))
                             log(f"  Description updates complete ({n_owned} playlists processed)")
                     except Exception as e:
                         log(f"  Update all descriptions failed (non-fatal): {e}")
@@ -342,12 +376,11 @@ Examples:
                 with timed_step("Playlist Health Check"):
                     try:
                         from .playlist_organization import get_playlist_organization_report, print_organization_report
-                        import pandas as pd
-                        playlists_df = pd.read_parquet(DATA_DIR / "playlists.parquet")
-                        playlist_tracks_df = pd.read_parquet(DATA_DIR / "playlist_tracks.parquet")
-                        tracks_df = pd.read_parquet(DATA_DIR / "tracks.parquet")
+                        playlists_df = _read_frame("playlists")
+                        playlist_tracks_df = _read_frame("playlist_tracks")
+                        tracks_df = _read_frame("tracks")
                         owned_playlists = (
-                            playlists_df[playlists_df["is_owned"] == True].copy()
+                            playlists_df.loc[playlists_df["is_owned"].to_numpy(dtype=bool, na_value=False)].copy()
                             if "is_owned" in playlists_df.columns
                             else playlists_df.copy()
                         )
@@ -363,14 +396,12 @@ Examples:
                 with timed_step("Generating Insights Report"):
                     try:
                         from .playlist_intelligence import generate_listening_insights_report
-                        import pandas as pd
-                        playlists_df = pd.read_parquet(DATA_DIR / "playlists.parquet")
-                        playlist_tracks_df = pd.read_parquet(DATA_DIR / "playlist_tracks.parquet")
-                        tracks_df = pd.read_parquet(DATA_DIR / "tracks.parquet")
+                        playlists_df = _read_frame("playlists")
+                        playlist_tracks_df = _read_frame("playlist_tracks")
+                        tracks_df = _read_frame("tracks")
                         streaming_history_df = None
-                        streaming_path = DATA_DIR / "streaming_history.parquet"
-                        if streaming_path.exists():
-                            streaming_history_df = pd.read_parquet(streaming_path)
+                        if (get_sync_data_dir() / "streaming_history.parquet").exists():
+                            streaming_history_df = _read_frame("streaming_history")
                         report = generate_listening_insights_report(
                             playlists_df, playlist_tracks_df, tracks_df, streaming_history_df
                         )
@@ -395,6 +426,9 @@ Examples:
         success = False
     
     finally:
+        # Write out description snapshot ids batched during this run
+        flush_description_snapshot_cache()
+        save_rate_state(rate_state_path)
         # Send email notification
         _send_email_notification(success, summary=summary, error=error)
         
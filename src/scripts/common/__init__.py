@@ -32,6 +32,11 @@ def __getattr__(name):
         )
         return globals()[name]
 
+    _sidecar_names = {"sidecar_path", "read_sidecar", "write_sidecar"}
+    if name in _sidecar_names:
+        from . import sidecar
+        return getattr(sidecar, name)
+
     if name == "trigger_incremental_sync":
         from .sync_helpers import trigger_incremental_sync
         return trigger_incremental_sync
@@ -58,4 +63,8 @@ __all__ = [
     "add_tracks_to_playlist",
     # Sync helpers
     "trigger_incremental_sync",
+    # JSON sidecar files
+    "sidecar_path",
+    "read_sidecar",
+    "write_sidecar",
 ]
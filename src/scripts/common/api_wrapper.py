@@ -8,9 +8,11 @@ Provides a consistent interface for all Spotify API calls with:
 - Logging
 """
 
+import threading
 import time
 import random
 import logging
+from pathlib import Path
 from typing import Callable, Any, Optional
 from functools import wraps
 import requests
@@ -19,22 +21,114 @@ import spotipy
 from src.scripts.automation.config import (
     API_RATE_LIMIT_MAX_RETRIES,
     API_RATE_LIMIT_DELAY,
+    API_RATE_LIMIT_BURST,
     API_RATE_LIMIT_BACKOFF_MULTIPLIER,
     API_RATE_LIMIT_INITIAL_DELAY
 )
 from src.scripts.automation.error_handling import get_logger, RetryableError
+from src.scripts.common.sidecar import read_sidecar, write_sidecar
 
 logger = get_logger()
 
 # Global adaptive backoff multiplier
 _RATE_BACKOFF_MULTIPLIER = API_RATE_LIMIT_BACKOFF_MULTIPLIER
 _RATE_BACKOFF_MAX = 16.0
+# api_call runs from worker threads: read-modify-write the multiplier under this lock
+_rate_backoff_lock = threading.Lock()
+
+# Backoff state that load_rate_state/save_rate_state carry between runs
+_RATE_STATE_MAX_AGE = 3600  # seconds; older state is ignored
+_last_retry_after: Optional[int] = None
+_last_retry_after_at = 0.0
+_retry_after_until = 0.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: up to ``capacity`` calls back-to-back, then
+    ``rate`` calls per second. Callers sleep only when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, slowdown: float = 1.0) -> float:
+        """
+        Take one token and return how long the caller must sleep before using it.
+
+        ``slowdown`` divides the refill rate (the adaptive backoff multiplier).
+        A negative balance reserves future tokens, so concurrent callers queue up
+        instead of all waking at once.
+        """
+        rate = self.rate / max(1.0, slowdown)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return -self._tokens / rate if self._tokens < 0 else 0.0
+
+    def drain(self) -> None:
+        """Empty the bucket (after a 429) so the next calls wait for a refill."""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = time.monotonic()
+
+
+# One bucket for the whole process: concurrent pools share the same request budget.
+# The refill rate matches the old serial pace (one call per API_RATE_LIMIT_DELAY).
+_bucket = TokenBucket(1.0 / API_RATE_LIMIT_DELAY, API_RATE_LIMIT_BURST)
+
+
+def load_rate_state(path: Path) -> None:
+    """
+    Restore the backoff multiplier (and a pending Retry-After) saved by a previous run.
+    
+    Missing, unreadable or stale (older than an hour) state is ignored.
+    """
+    global _RATE_BACKOFF_MULTIPLIER, _last_retry_after, _last_retry_after_at, _retry_after_until
+    state = read_sidecar(path)
+    try:
+        now = time.time()
+        with _rate_backoff_lock:
+            if now - float(state.get("updated_at", 0)) < _RATE_STATE_MAX_AGE:
+                multiplier = float(state.get("multiplier", _RATE_BACKOFF_MULTIPLIER))
+                _RATE_BACKOFF_MULTIPLIER = min(_RATE_BACKOFF_MAX, max(1.0, multiplier))
+            retry_after = state.get("retry_after")
+            retry_after_at = float(state.get("retry_after_at") or 0)
+            # Only a Retry-After whose wait has not yet elapsed is still pending
+            if retry_after and retry_after_at + float(retry_after) > now:
+                _last_retry_after = int(retry_after)
+                _last_retry_after_at = retry_after_at
+                _retry_after_until = retry_after_at + _last_retry_after
+    except (ValueError, TypeError):
+        pass
+
+
+def save_rate_state(path: Path) -> None:
+    """Write the current backoff multiplier and last Retry-After for the next run."""
+    with _rate_backoff_lock:
+        state = {
+            "multiplier": _RATE_BACKOFF_MULTIPLIER,
+            "updated_at": time.time(),
+            "retry_after": _last_retry_after,
+            "retry_after_at": _last_retry_after_at,
+        }
+    try:
+        write_sidecar(path, state)
+    except OSError as e:
+        logger.debug(f"Could not save rate limit state: {e}")
 
 
 def reset_rate_backoff() -> None:
     """Reset the rate limit backoff multiplier to default."""
     global _RATE_BACKOFF_MULTIPLIER
-    _RATE_BACKOFF_MULTIPLIER = API_RATE_LIMIT_BACKOFF_MULTIPLIER
+    with _rate_backoff_lock:
+        _RATE_BACKOFF_MULTIPLIER = API_RATE_LIMIT_BACKOFF_MULTIPLIER
 
 
 def get_rate_backoff_multiplier() -> float:
@@ -75,6 +169,7 @@ def api_call(
         spotipy.SpotifyException: For non-retryable errors
     """
     global _RATE_BACKOFF_MULTIPLIER
+    global _last_retry_after, _last_retry_after_at, _retry_after_until
     
     fn_name = getattr(fn, '__name__', str(fn))
     
@@ -85,21 +180,26 @@ def api_call(
         if kwargs:
             logger.debug(f"  Kwargs: {list(kwargs.keys())}")
     
+    # Respect a pending Retry-After (from a 429 earlier in this run or restored by
+    # load_rate_state) before spending a request
+    pending = _retry_after_until - time.time()
+    if pending > 0:
+        logger.debug(f"  Waiting {pending:.1f}s for pending Retry-After")
+        time.sleep(pending)
+    
     for attempt in range(max_retries):
+        # Throttle: sleeps only when the token bucket is empty
+        sleep = _bucket.consume(_RATE_BACKOFF_MULTIPLIER)
+        if sleep:
+            if verbose and sleep > 0.2:
+                logger.debug(f"  API delay: {sleep:.2f}s (backoff: {_RATE_BACKOFF_MULTIPLIER:.2f})")
+            time.sleep(sleep)
         try:
             result = fn(*args, **kwargs)
             
-            # Adaptive delay between successful calls
-            base_delay = API_RATE_LIMIT_DELAY
-            delay = base_delay * _RATE_BACKOFF_MULTIPLIER
-            
-            if delay > 0:
-                if verbose and delay > 0.2:
-                    logger.debug(f"  API delay: {delay:.2f}s (backoff: {_RATE_BACKOFF_MULTIPLIER:.2f})")
-                time.sleep(delay)
-            
             # Decay multiplier on success
-            _RATE_BACKOFF_MULTIPLIER = max(1.0, _RATE_BACKOFF_MULTIPLIER * 0.90)
+            with _rate_backoff_lock:
+                _RATE_BACKOFF_MULTIPLIER = max(1.0, _RATE_BACKOFF_MULTIPLIER * 0.90)
             
             return result
             
@@ -116,6 +216,11 @@ def api_call(
             
             if is_rate or is_transient:
                 wait = _calculate_backoff(attempt, backoff_factor, retry_after)
+                if retry_after:
+                    with _rate_backoff_lock:
+                        _last_retry_after = retry_after
+                        _last_retry_after_at = time.time()
+                        _retry_after_until = _last_retry_after_at + retry_after
                 
                 logger.warning(
                     f"Transient/rate error: {e} — retrying in {wait:.1f}s "
@@ -126,10 +231,13 @@ def api_call(
                     logger.debug(f"  API call {fn_name}() failed with status {status}, retry_after={retry_after}")
                 
                 time.sleep(wait)
+                if is_rate:
+                    _bucket.drain()
                 
                 # Increase adaptive multiplier
-                old_mult = _RATE_BACKOFF_MULTIPLIER
-                _RATE_BACKOFF_MULTIPLIER = min(_RATE_BACKOFF_MAX, _RATE_BACKOFF_MULTIPLIER * 2.0)
+                with _rate_backoff_lock:
+                    old_mult = _RATE_BACKOFF_MULTIPLIER
+                    _RATE_BACKOFF_MULTIPLIER = min(_RATE_BACKOFF_MAX, _RATE_BACKOFF_MULTIPLIER * 2.0)
                 
                 if verbose and _RATE_BACKOFF_MULTIPLIER != old_mult:
                     logger.debug(f"  Increased backoff multiplier: {old_mult:.2f} → {_RATE_BACKOFF_MULTIPLIER:.2f}")
@@ -130,7 +130,7 @@ def uri_to_track_id(track_uri: str) -> str:
         Track ID
     """
     if track_uri.startswith("spotify:track:"):
-        return track_uri.replace("spotify:track:", "")
+        return track_uri[len("spotify:track:"):]
     return track_uri
 
 
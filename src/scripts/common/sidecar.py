@@ -0,0 +1,41 @@
+"""
+JSON sidecar files.
+
+Small state files kept next to the parquet exports in the data directory
+(snapshot ids, track-set digests, rate-limit backoff) so incremental runs can
+skip work. All of them are hidden and named ``.<topic>_cache.json``.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+def sidecar_path(data_dir, topic: str) -> Path:
+    """Path of the sidecar file for ``topic`` in ``data_dir``."""
+    return Path(data_dir) / f".{topic}_cache.json"
+
+
+def read_sidecar(path: Path) -> dict:
+    """Return the JSON object stored at ``path``, or {} if it is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_sidecar(path: Path, data: dict) -> None:
+    """
+    Write ``data`` to ``path`` via a temporary file and rename, so a crash
+    mid-write never leaves a truncated file behind.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=0)
+    os.replace(tmp_path, path)
@@ -128,12 +128,12 @@ def merge_multiple_playlists(sp: spotipy.Spotify, playlist_names: list[str], new
     total_added = 0
     total_duplicates = 0
     deleted_count = 0
+    final_oldest_tracks = None  # latest fetch of the target taken after all adds so far
     
     for other_name, other_pl in other_playlists:
         other_id = other_pl['playlist_id']
         print(f"\n📥 Fetching tracks from {other_name}...")
         other_tracks = get_playlist_tracks(sp, other_id, force_refresh=True)
-        other_tracks_set = other_tracks.copy()  # Keep for verification
         print(f"   Found {len(other_tracks)} tracks")
         
         # Find tracks to add
@@ -158,7 +158,8 @@ def merge_multiple_playlists(sp: spotipy.Spotify, playlist_names: list[str], new
                     print(f"   ✗ Failed to add chunk {chunk_count}: {e}")
                     raise
             
-            oldest_tracks = oldest_tracks | tracks_to_add  # Update track set
+            oldest_tracks.update(tracks_to_add)  # Update track set in place (our own fresh set)
+            final_oldest_tracks = None
             total_added += len(tracks_to_add)
             print(f"   ✓ Successfully added {len(tracks_to_add)} tracks")
         else:
@@ -170,7 +171,7 @@ def merge_multiple_playlists(sp: spotipy.Spotify, playlist_names: list[str], new
         if delete_others:
             print(f"   🔍 Verifying all tracks are preserved before deletion...")
             final_oldest_tracks = get_playlist_tracks(sp, oldest_id, force_refresh=True)
-            missing_tracks = other_tracks_set - final_oldest_tracks
+            missing_tracks = other_tracks - final_oldest_tracks
             
             if missing_tracks:
                 print(f"   ⚠️  WARNING: {len(missing_tracks)} tracks from '{other_name}' are NOT in target playlist!")
@@ -192,7 +193,10 @@ def merge_multiple_playlists(sp: spotipy.Spotify, playlist_names: list[str], new
                 success, backup_file = safe_delete_playlist(
                     sp, other_id, other_name,
                     create_backup=True,
-                    verify_tracks_preserved_in=oldest_id
+                    verify_tracks_preserved_in=oldest_id,
+                    # Both playlists were fetched above and are unchanged: reuse them, no refetch
+                    preserved_tracks=final_oldest_tracks,
+                    tracks=other_tracks
                 )
                 if success:
                     print(f"   ✓ Deleted: {other_name}")
@@ -202,13 +206,10 @@ def merge_multiple_playlists(sp: spotipy.Spotify, playlist_names: list[str], new
                     if backup_file:
                         print(f"   💾 Backup created: {backup_file.name}")
     
-    # Final verification
-    final_tracks = get_playlist_tracks(sp, oldest_id, force_refresh=True)
-    all_source_tracks = set()
-    # Collect all tracks from other playlists (already merged, just for verification)
-    for other_name, other_pl in other_playlists:
-        # Tracks were already merged, so we just verify final count
-        pass
+    # Final verification (reuse the last pre-deletion fetch if nothing was added after it)
+    final_tracks = final_oldest_tracks
+    if final_tracks is None:
+        final_tracks = get_playlist_tracks(sp, oldest_id, force_refresh=True)
     
     # Simple verification: check that we have at least as many tracks as expected
     initial_track_count = len(oldest_tracks)
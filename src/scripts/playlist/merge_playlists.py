@@ -176,7 +176,10 @@ def merge_playlists(sp: spotipy.Spotify, playlist1_name: str, playlist2_name: st
             success, backup_file = safe_delete_playlist(
                 sp, source_id, source_name,
                 create_backup=True,
-                verify_tracks_preserved_in=target_id
+                verify_tracks_preserved_in=target_id,
+                # Both playlists were fetched above and are unchanged: reuse them, no refetch
+                preserved_tracks=final_target_tracks,
+                tracks=source_tracks
             )
             if success:
                 print(f"   ✓ Deleted: {source_name}")
@@ -185,8 +188,10 @@ def merge_playlists(sp: spotipy.Spotify, playlist1_name: str, playlist2_name: st
                 if backup_file:
                     print(f"   💾 Backup created: {backup_file.name}")
     
-    # Final verification
-    final_target_tracks = get_playlist_tracks(sp, target_id, force_refresh=True)
+    # Final verification (the pre-deletion fetch already reflects every add; deleting
+    # the source does not touch the target, so only fetch if there was no such check)
+    if not delete_newer:
+        final_target_tracks = get_playlist_tracks(sp, target_id, force_refresh=True)
     print(f"\n✅ Merge complete!")
     print(f"   • '{target_name}' now contains {len(final_target_tracks)} tracks")
     print(f"   • Added {len(tracks_to_add)} unique tracks")
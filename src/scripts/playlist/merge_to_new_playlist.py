@@ -205,7 +205,10 @@ def merge_to_new_playlist(sp: spotipy.Spotify, playlist1_name: str, playlist2_na
             success, backup_file = safe_delete_playlist(
                 sp, newer_id, newer_name,
                 create_backup=True,
-                verify_tracks_preserved_in=older_id
+                verify_tracks_preserved_in=older_id,
+                # Both playlists were fetched above and are unchanged: reuse them, no refetch
+                preserved_tracks=final_older_tracks,
+                tracks=newer_tracks
             )
             if success:
                 print(f"   ✓ Deleted: {newer_name}")
@@ -214,8 +217,12 @@ def merge_to_new_playlist(sp: spotipy.Spotify, playlist1_name: str, playlist2_na
                 if backup_file:
                     print(f"   💾 Backup created: {backup_file.name}")
     
-    # Final verification
-    final_tracks = get_playlist_tracks(sp, older_id, force_refresh=True)
+    # Final verification (the pre-deletion fetch already reflects every add; deleting
+    # the newer playlist does not touch the target, so only fetch if there was no such check)
+    if delete_newer:
+        final_tracks = final_older_tracks
+    else:
+        final_tracks = get_playlist_tracks(sp, older_id, force_refresh=True)
     expected_tracks = older_tracks | newer_tracks
     
     print(f"\n✅ Merge complete!")
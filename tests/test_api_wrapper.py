@@ -0,0 +1,87 @@
+import json
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.scripts.common import api_wrapper
+
+
+class TestRateState(unittest.TestCase):
+    _STATE = (
+        "_RATE_BACKOFF_MULTIPLIER",
+        "_last_retry_after",
+        "_last_retry_after_at",
+        "_retry_after_until",
+    )
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = Path(self.test_dir) / ".rate_limit_cache.json"
+        self.saved = {name: getattr(api_wrapper, name) for name in self._STATE}
+
+    def tearDown(self):
+        for name, value in self.saved.items():
+            setattr(api_wrapper, name, value)
+        shutil.rmtree(self.test_dir)
+
+    def _write_state(self, **state):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+    def test_round_trip(self):
+        now = time.time()
+        api_wrapper._RATE_BACKOFF_MULTIPLIER = 2.5
+        api_wrapper._last_retry_after = 60
+        api_wrapper._last_retry_after_at = now
+        api_wrapper.save_rate_state(self.path)
+
+        api_wrapper.reset_rate_backoff()
+        api_wrapper._last_retry_after = None
+        api_wrapper._retry_after_until = 0.0
+        api_wrapper.load_rate_state(self.path)
+
+        self.assertEqual(api_wrapper.get_rate_backoff_multiplier(), 2.5)
+        self.assertEqual(api_wrapper._last_retry_after, 60)
+        self.assertAlmostEqual(api_wrapper._retry_after_until, now + 60, places=3)
+
+    def test_restores_retry_after_still_pending(self):
+        now = time.time()
+        self._write_state(multiplier=1.0, updated_at=now, retry_after=60, retry_after_at=now - 30)
+        api_wrapper._retry_after_until = 0.0
+
+        api_wrapper.load_rate_state(self.path)
+
+        self.assertAlmostEqual(api_wrapper._retry_after_until, now + 30, places=3)
+
+    def test_ignores_elapsed_retry_after(self):
+        now = time.time()
+        self._write_state(multiplier=1.0, updated_at=now, retry_after=10, retry_after_at=now - 30)
+        api_wrapper._retry_after_until = 0.0
+
+        api_wrapper.load_rate_state(self.path)
+
+        self.assertEqual(api_wrapper._retry_after_until, 0.0)
+
+    def test_ignores_stale_multiplier(self):
+        self._write_state(multiplier=3.0, updated_at=time.time() - 2 * 3600)
+        api_wrapper.reset_rate_backoff()
+        before = api_wrapper.get_rate_backoff_multiplier()
+
+        api_wrapper.load_rate_state(self.path)
+
+        self.assertEqual(api_wrapper.get_rate_backoff_multiplier(), before)
+
+    def test_missing_or_invalid_file_is_ignored(self):
+        api_wrapper.reset_rate_backoff()
+        before = api_wrapper.get_rate_backoff_multiplier()
+        api_wrapper.load_rate_state(self.path)
+        self.path.write_text("{not json", encoding="utf-8")
+        api_wrapper.load_rate_state(self.path)
+
+        self.assertEqual(api_wrapper.get_rate_backoff_multiplier(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.scripts.automation import data_protection
+
+
+class TestSafeDeletePlaylist(unittest.TestCase):
+    def setUp(self):
+        self.mock_sp = MagicMock()
+        self.mock_sp.me.return_value = {"id": "test_user"}
+        patcher = patch("src.scripts.automation.sync.log")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _delete(self, fresh_tracks, preserved_tracks):
+        with patch(
+            "src.scripts.automation.sync.get_playlist_tracks", return_value=fresh_tracks
+        ) as get_tracks:
+            result = data_protection.safe_delete_playlist(
+                self.mock_sp, "monthly1", "Finds Jan 24",
+                create_backup=False,
+                verify_tracks_preserved_in="yearly1",
+                preserved_tracks=preserved_tracks,
+            )
+        return result, get_tracks
+
+    def test_rereads_tracks_before_delete(self):
+        (success, _), get_tracks = self._delete({"spotify:track:a"}, {"spotify:track:a"})
+
+        self.assertTrue(success)
+        get_tracks.assert_called_once_with(self.mock_sp, "monthly1", force_refresh=True)
+        self.mock_sp.user_playlist_unfollow.assert_called_once_with("test_user", "monthly1")
+
+    def test_refuses_when_fresh_tracks_missing_from_target(self):
+        # A track added since any earlier fetch must block the delete
+        (success, _), _ = self._delete(
+            {"spotify:track:a", "spotify:track:new"}, {"spotify:track:a"}
+        )
+
+        self.assertFalse(success)
+        self.mock_sp.user_playlist_unfollow.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
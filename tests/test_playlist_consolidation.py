@@ -0,0 +1,113 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.scripts.automation import playlist_consolidation
+from src.scripts.automation.playlist_consolidation import _track_set_digest
+
+
+class TestTrackSetDigest(unittest.TestCase):
+    def test_order_independent(self):
+        self.assertEqual(
+            _track_set_digest(["spotify:track:a", "spotify:track:b"]),
+            _track_set_digest(["spotify:track:b", "spotify:track:a"]),
+        )
+
+    def test_distinguishes_sets_of_the_same_size(self):
+        self.assertNotEqual(
+            _track_set_digest({"spotify:track:a", "spotify:track:b"}),
+            _track_set_digest({"spotify:track:a", "spotify:track:c"}),
+        )
+
+    def test_is_128_bit(self):
+        self.assertEqual(len(_track_set_digest({"spotify:track:a"})), 16)
+
+
+class TestDeleteDuplicatePlaylists(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.mock_sp = MagicMock()
+        # {playlist_id: (name, snapshot_id, track URIs)}
+        self.playlists = {
+            "p1": ("Alpha", "snap1", ["spotify:track:a", "spotify:track:b"]),
+            "p2": ("Beta", "snap2", ["spotify:track:b", "spotify:track:a"]),
+            "p3": ("Gamma", "snap3", ["spotify:track:a", "spotify:track:c"]),
+        }
+        self.safe_delete = MagicMock(return_value=(True, None))
+        sync = "src.scripts.automation.sync"
+        patches = [
+            patch("src.scripts.automation._sync_impl.settings.get_sync_data_dir",
+                  return_value=Path(self.test_dir)),
+            patch(f"{sync}.log"),
+            patch(f"{sync}.verbose_log"),
+            patch(f"{sync}._invalidate_playlist_cache"),
+            patch(f"{sync}.get_user_info", return_value={"id": "test_user"}),
+            patch(f"{sync}.get_existing_playlists", side_effect=lambda *a, **k: {
+                name: pid for pid, (name, _, _) in self.playlists.items()
+            }),
+            patch(f"{sync}.get_playlist_track_total",
+                  side_effect=lambda sp, pid: len(self.playlists[pid][2])),
+            patch(f"{sync}.get_playlist_snapshot_id",
+                  side_effect=lambda sp, pid: self.playlists[pid][1]),
+            patch("src.scripts.automation.data_protection.safe_delete_playlist", self.safe_delete),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.streamed = []
+        stream = patch(f"{sync}.iter_playlist_track_uris", side_effect=self._stream)
+        stream.start()
+        self.addCleanup(stream.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _stream(self, sp, playlist_id):
+        self.streamed.append(playlist_id)
+        return iter(self.playlists[playlist_id][2])
+
+    def _cache_file(self):
+        return Path(self.test_dir) / ".playlist_digest_cache.json"
+
+    def test_deletes_playlist_with_same_track_set(self):
+        playlist_consolidation.delete_duplicate_playlists(self.mock_sp)
+
+        self.safe_delete.assert_called_once()
+        args, kwargs = self.safe_delete.call_args
+        self.assertEqual(args[1:], ("p2", "Beta"))
+        self.assertEqual(kwargs["verify_tracks_preserved_in"], "p1")
+
+    def test_digest_cache_round_trip(self):
+        del self.playlists["p2"]
+        playlist_consolidation.delete_duplicate_playlists(self.mock_sp)
+
+        with open(self._cache_file(), encoding="utf-8") as f:
+            cache = json.load(f)
+        self.assertEqual(set(cache), {"p1", "p3"})
+        self.assertEqual(cache["p1"][:2], ["snap1", 2])
+        self.assertEqual(cache["p1"][2], _track_set_digest(self.playlists["p1"][2]).hex())
+        self.assertCountEqual(self.streamed, ["p1", "p3"])
+
+        # Unchanged snapshots are answered from the cache; a changed one is re-streamed
+        self.streamed.clear()
+        self.playlists["p3"] = ("Gamma", "snap3b", ["spotify:track:a", "spotify:track:d"])
+        playlist_consolidation.delete_duplicate_playlists(self.mock_sp)
+
+        self.assertEqual(self.streamed, ["p3"])
+        self.safe_delete.assert_not_called()
+
+    def test_malformed_cache_entries_are_misses(self):
+        with open(self._cache_file(), "w", encoding="utf-8") as f:
+            json.dump({"p1": ["snap1"], "p2": "snap2", "p3": ["snap3", 2, ""]}, f)
+
+        playlist_consolidation.delete_duplicate_playlists(self.mock_sp)
+
+        self.assertCountEqual(self.streamed, ["p1", "p2", "p3"])
+        self.safe_delete.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.scripts.automation._sync_impl import renames
+from src.scripts.automation._sync_impl.catalog import _PlaylistNameMap
+
+
+class TestPlaylistNameMap(unittest.TestCase):
+    def setUp(self):
+        self.names = _PlaylistNameMap({"AJam - HipHop": "p1", "AJFindsJan24": "p2"})
+
+    def test_lookups_ignore_case(self):
+        self.assertIn("AJam - Hiphop", self.names)
+        self.assertEqual(self.names["ajam - hiphop"], "p1")
+        self.assertEqual(self.names.get("AJFINDSJAN24"), "p2")
+        self.assertIsNone(self.names.get("AJFindsFeb24"))
+        self.assertEqual(list(self.names), ["AJam - HipHop", "AJFindsJan24"])
+
+    def test_has_exact_does_not_fold_case(self):
+        self.assertTrue(self.names.has_exact("AJam - HipHop"))
+        self.assertFalse(self.names.has_exact("AJam - Hiphop"))
+
+    def test_mutations_keep_index_current(self):
+        self.names.update({"AJTopJan24": "p3"})
+        self.assertEqual(self.names["ajtopjan24"], "p3")
+        self.names |= {"AJDscvrJan24": "p4"}
+        self.assertEqual(self.names["ajdscvrjan24"], "p4")
+        self.assertEqual(self.names.setdefault("ajtopjan24", "other"), "p3")
+        self.assertEqual(self.names.pop("AJTOPJAN24"), "p3")
+        self.assertNotIn("AJTopJan24", self.names)
+        del self.names["ajdscvrjan24"]
+        self.assertNotIn("AJDscvrJan24", self.names)
+
+    def test_copy_and_union_keep_type(self):
+        for other in (self.names.copy(), self.names | {"AJTopJan24": "p3"}):
+            self.assertIsInstance(other, _PlaylistNameMap)
+            self.assertEqual(other["ajam - hiphop"], "p1")
+
+
+class TestRenamePlaylistsWithOldPrefixes(unittest.TestCase):
+    def setUp(self):
+        self.mock_sp = MagicMock()
+        self.existing = _PlaylistNameMap()
+        patches = [
+            patch.object(renames, "PREFIX_MONTHLY", "Finds"),
+            patch.object(renames, "PREFIX_MOST_PLAYED", "Most"),
+            patch.object(renames, "PREFIX_DISCOVERY", "Dsc"),
+            patch.object(renames, "log"),
+            patch.object(renames, "_invalidate_playlist_cache"),
+            patch.object(renames, "get_user_info", return_value={"id": "test_user"}),
+            patch.object(renames, "get_existing_playlists", side_effect=lambda *a, **k: self.existing),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.api_call = MagicMock()
+        api = patch.object(renames, "api_call", self.api_call)
+        api.start()
+        self.addCleanup(api.stop)
+
+    def _renamed(self):
+        """{playlist_id: new name} for every rename sent to the API."""
+        return {call.args[2]: call.kwargs["name"] for call in self.api_call.call_args_list}
+
+    def test_skips_rename_onto_existing_name(self):
+        self.existing.update({"AJAutoJan24": "p1", "AJFindsJan24": "p2"})
+
+        renames.rename_playlists_with_old_prefixes(self.mock_sp)
+
+        self.assertEqual(self._renamed(), {})
+
+    def test_name_differing_only_in_case_does_not_block_rename(self):
+        self.existing.update({"AJAutoJan24": "p1", "AJfindsJan24": "p2"})
+
+        renames.rename_playlists_with_old_prefixes(self.mock_sp)
+
+        self.assertEqual(self._renamed(), {"p1": "AJFindsJan24"})
+
+    def test_rewrites_prefix_in_template_names(self):
+        self.existing.update({
+            "AJAutoJan24": "p1",
+            "AJTop2023": "p2",
+            "AJDiscoveryFeb24": "p3",
+            "AJDiscoverMar24": "p4",
+            "AUTO Mix": "p5",
+        })
+
+        renames.rename_playlists_with_old_prefixes(self.mock_sp)
+
+        self.assertEqual(self._renamed(), {
+            "p1": "AJFindsJan24",
+            "p2": "AJMost2023",
+            "p3": "AJDscFeb24",
+            "p4": "AJDscMar24",
+            "p5": "FINDS Mix",
+        })
+
+    def test_leaves_old_prefix_inside_words_alone(self):
+        self.existing.update({"Topic Mix": "p1", "Autumn Auto": "p2"})
+
+        renames.rename_playlists_with_old_prefixes(self.mock_sp)
+
+        self.assertEqual(self._renamed(), {"p2": "Autumn Finds"})
+
+    def test_replaces_only_the_first_old_prefix(self):
+        self.existing.update({"AJTopJan24 Top": "p1"})
+
+        renames.rename_playlists_with_old_prefixes(self.mock_sp)
+
+        self.assertEqual(self._renamed(), {"p1": "AJMostJan24 Top"})
+
+
+if __name__ == "__main__":
+    unittest.main()